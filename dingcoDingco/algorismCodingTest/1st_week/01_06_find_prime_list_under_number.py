@@ -52,7 +52,12 @@ def find_prime_list_under_number(number):
             # 더 효율적인 solution
             # 위의 내가 푼 제곱근 방법+소수만 이용방법
             # N의 제곱근보다 크지 않은 어떤 소수로도 나누어 떨어지지 않는다.
-            if i * i <= n and n % i == 0:
+            # i * i > n 이 되면 남은 소수는 볼 필요가 없으므로 바로 멈춘다.
+            # (i * i <= n and n % i == 0 으로만 검사하면 끝까지 다 돌게 된다)
+            if i * i > n:
+                prime_list.append(n)
+                break
+            if n % i == 0:
                 break
         else:
             prime_list.append(n)
@@ -0,0 +1,175 @@
+# Q. 정수를 입력 했을 때, 그 정수 이하의 소수를 모두 반환하시오.
+#
+# 01_06 풀이는 소수마다 나눗셈을 해 보므로 10^9 같은 큰 수에는 쓸 수 없다.
+# 에라토스테네스의 체로 "소수의 배수"를 한꺼번에 지워 나가면 O(N log log N) 이다.
+#
+# - 작은 수: bytearray 한 장으로 체를 친다. (numpy 가 있으면 numpy 로)
+# - 큰 수: sqrt(N) 까지의 소수만 먼저 구한 뒤, L2 캐시 크기 구간(segment)씩 잘라서 체를 친다.
+#   메모리는 구간 크기만큼만 쓰고, 구간이 끝날 때마다 소수를 하나씩 내보낸다(generator).
+# - 구간끼리는 서로 상관이 없으므로 여러 프로세스에서 나눠 칠 수도 있다.
+
+import math
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+input = 20
+
+# 홀수만 저장하므로 한 구간이 256KB 면 숫자 512K 개를 덮는다.
+SEGMENT_SIZE = 256 * 1024
+SMALL_LIMIT = 10_000_000
+
+
+def simple_sieve(number):
+    # 홀수만 저장한다. flags[k] 는 2k + 1 이 소수인지 여부
+    if number < 2:
+        return []
+    size = (number - 1) // 2 + 1
+    flags = bytearray([1]) * size
+    flags[0] = 0  # 1은 소수가 아니다
+    for k in range(1, (math.isqrt(number) - 1) // 2 + 1):
+        if flags[k]:
+            p = 2 * k + 1
+            # p*p 부터 2p 간격(홀수 배수만)으로 지운다. 슬라이스 대입은 C 에서 한 번에 처리된다.
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return [2] + [2 * k + 1 for k in compress(range(size), flags)]
+
+
+def simple_sieve_numpy(number):
+    if number < 2:
+        return []
+    size = (number - 1) // 2 + 1
+    flags = np.ones(size, dtype=np.bool_)
+    flags[0] = False
+    for k in range(1, (math.isqrt(number) - 1) // 2 + 1):
+        if flags[k]:
+            p = 2 * k + 1
+            flags[p * p // 2::p] = False
+    return [2] + (2 * np.flatnonzero(flags) + 1).tolist()
+
+
+def sieve_segment(low, high, base_primes):
+    # [low, high) 구간의 홀수 소수 표시. low 는 홀수여야 한다.
+    size = (high - low + 1) // 2
+    flags = bytearray([1]) * size
+    for p in base_primes:
+        if p == 2:
+            continue
+        if p * p >= high:
+            break
+        # 구간 안에서 처음 지울 p 의 홀수 배수
+        start = max(p * p, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        first = (start - low) // 2
+        if first < size:
+            flags[first::p] = bytes(len(range(first, size, p)))
+    if low == 1:
+        flags[0] = 0
+    return flags
+
+
+def segments(number, segment_size=SEGMENT_SIZE):
+    # 홀수 시작점 기준 [low, high) 구간들
+    span = segment_size * 2
+    low = 1
+    while low <= number:
+        high = min(low + span, number + 1)
+        yield low, high
+        low = high if high % 2 else high + 1
+
+
+def segment_primes(low, high, base_primes):
+    return list(compress(range(low, high, 2), sieve_segment(low, high, base_primes)))
+
+
+# 작업 프로세스마다 한 번만 받아 두는 sqrt(N) 이하 소수. 구간마다 다시 보내지 않는다.
+_worker_base_primes = []
+
+
+def _init_worker(base_primes):
+    global _worker_base_primes
+    _worker_base_primes = base_primes
+
+
+def _segment_primes(bounds):
+    low, high = bounds
+    return segment_primes(low, high, _worker_base_primes)
+
+
+def _segment_count(bounds):
+    low, high = bounds
+    return sieve_segment(low, high, _worker_base_primes).count(1)
+
+
+def iter_primes(number, segment_size=SEGMENT_SIZE, workers=None):
+    # number 이하의 소수를 작은 것부터 하나씩 내보낸다.
+    if number < 2:
+        return
+    yield 2
+    base_primes = simple_sieve(math.isqrt(number))
+    if not workers:
+        for low, high in segments(number, segment_size):
+            yield from segment_primes(low, high, base_primes)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base_primes,)) as executor:
+        # map 은 모든 구간을 한꺼번에 제출해서 못 꺼낸 결과가 쌓인다.
+        # workers 의 두 배만 앞서 제출하고, 제출한 순서대로 꺼내 소수 순서를 지킨다.
+        pending = deque()
+        try:
+            for bounds in segments(number, segment_size):
+                pending.append(executor.submit(_segment_primes, bounds))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # 중간에 그만 읽으면 아직 시작하지 않은 구간은 버린다.
+            for future in pending:
+                future.cancel()
+
+
+def count_primes(number, segment_size=SEGMENT_SIZE, workers=None):
+    # 10^9 처럼 소수를 다 모으기엔 큰 경우, 구간마다 개수만 센다.
+    if number < 2:
+        return 0
+    base_primes = simple_sieve(math.isqrt(number))
+    if not workers:
+        return 1 + sum(sieve_segment(low, high, base_primes).count(1) for low, high in segments(number, segment_size))
+    # 결과가 정수 하나씩이라 map 으로 한꺼번에 제출해도 쌓이는 양이 작다.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base_primes,)) as executor:
+        return 1 + sum(executor.map(_segment_count, segments(number, segment_size), chunksize=4))
+
+
+def find_prime_list_under_number(number):
+    if number <= SMALL_LIMIT:
+        return simple_sieve_numpy(number) if np is not None else simple_sieve(number)
+    return list(iter_primes(number))
+
+
+if __name__ == "__main__":
+    # 실행
+    result = find_prime_list_under_number(input)
+    print(result)
+
+    # 확인: 세 방식이 같은 결과를 내는지
+    print("정답 = [2, 3, 5, 7, 11, 13, 17, 19] / 현재 풀이 값 = ", list(iter_primes(20, segment_size=4)))
+    print("정답 = True / 현재 풀이 값 = ", simple_sieve(100_000) == list(iter_primes(100_000, segment_size=1000)))
+    print("정답 = 78498 / 현재 풀이 값 = ", count_primes(1_000_000))
+
+    # 속도
+    for number in (10**7, 10**8):
+        start = time.perf_counter()
+        count = count_primes(number)
+        print(number, "이하 소수", count, "개", f"{time.perf_counter() - start:.2f}초")
+
+    start = time.perf_counter()
+    count = count_primes(10**8, workers=4)
+    print(10**8, "이하 소수", count, "개 (프로세스 4개)", f"{time.perf_counter() - start:.2f}초")
@@ -0,0 +1,78 @@
+# BOJ 1158 (요세푸스 문제) - 펜윅 트리 풀이
+#
+# 02_06 풀이는 list.pop(index) 가 O(N) 이라 전체가 O(N^2) 이다.
+# 남아 있는 사람을 1, 제거된 사람을 0 으로 두고 펜윅 트리(BIT)에 누적합을 저장하면
+# "남은 사람 중 m 번째"를 O(log N) 에 찾을 수 있다. -> 전체 O(N log N)
+#
+# - 결과를 한 번에 문자열로 만들지 않고, 일정 개수씩 writer 에 흘려 보낸다.
+# - 마지막 생존자만 필요하면 점화식 J(i) = (J(i-1) + K) % i 로 O(N) 에 구한다.
+
+import sys
+
+CHUNK_SIZE = 1 << 16
+
+
+def josephus_order(n, k):
+    # 제거되는 순서대로 번호를 하나씩 내보낸다.
+    # 모든 값이 1 이면 tree[i] = i & -i 이므로 O(N) 에 만들 수 있다.
+    tree = [i & -i for i in range(n + 1)]
+    top = 1 << (n.bit_length() - 1) if n else 0  # n 이하에서 가장 큰 2의 거듭제곱
+
+    index = 0  # 남은 사람 기준 현재 위치 (0부터)
+    for remaining in range(n, 0, -1):
+        index = (index + k - 1) % remaining
+        # 누적합이 index + 1 이 되는 가장 작은 위치를 이진 리프팅으로 찾는다.
+        target = index + 1
+        position = 0
+        step = top
+        while step:
+            next_position = position + step
+            if next_position <= n and tree[next_position] < target:
+                position = next_position
+                target -= tree[next_position]
+            step >>= 1
+        person = position + 1
+
+        # 찾은 사람을 제거(값 1 -> 0)
+        i = person
+        while i <= n:
+            tree[i] -= 1
+            i += i & -i
+        yield person
+
+
+def write_josephus(n, k, writer=sys.stdout, chunk_size=CHUNK_SIZE):
+    # "<3, 6, 2, 7, 5, 1, 4>" 형식을 chunk_size 개씩 나눠서 쓴다.
+    writer.write("<")
+    chunk = []
+    first = True
+    for person in josephus_order(n, k):
+        chunk.append(person)
+        if len(chunk) == chunk_size:
+            writer.write(("" if first else ", ") + ", ".join(map(str, chunk)))
+            first = False
+            chunk.clear()
+    if chunk:
+        writer.write(("" if first else ", ") + ", ".join(map(str, chunk)))
+    writer.write(">\n")
+
+
+def josephus_survivor(n, k):
+    # 마지막까지 남는 사람의 번호. 0부터 센 위치를 점화식으로 구한 뒤 1을 더한다.
+    survivor = 0
+    for i in range(2, n + 1):
+        survivor = (survivor + k) % i
+    return survivor + 1
+
+
+if __name__ == "__main__":
+    import io
+
+    # 확인
+    buffer = io.StringIO()
+    write_josephus(7, 3, buffer, chunk_size=2)
+    print("정답 = <3, 6, 2, 7, 5, 1, 4> / 현재 풀이 값 = ", buffer.getvalue().strip())
+    print("정답 = 4 / 현재 풀이 값 = ", josephus_survivor(7, 3))
+
+    n, k = map(int, sys.stdin.readline().split())
+    write_josephus(n, k)
@@ -0,0 +1,109 @@
+# Q. 음이 아닌 정수들로 이루어진 배열이 있다. 이 수를 적절히 더하거나 빼서 특정한 숫자를 만들려고 한다.
+# 사용할 수 있는 숫자가 담긴 배열 numbers, 타겟 넘버 target_number이 매개변수로 주어질 때
+# 숫자를 적절히 더하고 빼서 타겟 넘버를 만드는 방법의 수를 반환하시오.
+#
+# 02_16 풀이는 2^N 가지를 모두 만들어 보므로 숫자가 25개만 넘어가도 끝나지 않는다.
+#
+# + 를 붙일 숫자들의 합을 P, 전체 합을 S 라고 하면
+#   P - (S - P) = target  ->  P = (S + target) / 2
+# 즉 "합이 (S + target) / 2 가 되는 부분집합의 개수"를 세면 된다. (부분집합 합 세기)
+#
+# - dp[j] = 지금까지 본 숫자로 합 j 를 만드는 방법의 수. 숫자 a 마다 dp[j] += dp[j - a]
+#   numpy 가 있으면 배열 덧셈 한 번으로 갱신한다. 개수는 2^N 까지 커질 수 있으므로
+#   int64 를 넘을 수 있으면 파이썬 정수(object 배열)를 쓴다.
+# - 목표 합이 너무 크면(값의 범위가 큰 경우) 배열 대신 반씩 나눠 만든 합을 맞춰 본다(meet in the middle).
+
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+numbers = [1, 1, 1, 1, 1]
+target_number = 3
+
+# dp 배열 칸 수 * 숫자 개수가 이보다 크면 배열 DP 대신 다른 방법을 쓴다.
+DP_BUDGET = 200_000_000
+MEET_IN_THE_MIDDLE_LIMIT = 44
+
+
+def subset_target(array, target):
+    total = sum(array)
+    if abs(target) > total or (total + target) % 2:
+        return None
+    return (total + target) // 2
+
+
+def count_subsets_dp(array, goal):
+    # 배열 DP. 작은 수부터 보면서 지금까지의 합(reach)까지만 갱신한다. 그 뒤 칸은 아직 모두 0 이다.
+    zeros = sum(1 for a in array if a == 0)
+    values = sorted(a for a in array if 0 < a <= goal)
+    reach = 0
+
+    if np is not None:
+        # 경우의 수가 2^63 을 넘을 수 있으면 파이썬 정수로 계산한다.
+        dtype = np.int64 if len(array) < 63 else object
+        dp = np.zeros(goal + 1, dtype=dtype)
+        dp[0] = 1
+        for a in values:
+            reach = min(reach + a, goal)
+            # 오른쪽이 먼저 계산된 뒤 대입되므로 같은 숫자를 두 번 쓰지 않는다.
+            dp[a:reach + 1] = dp[a:reach + 1] + dp[:reach + 1 - a]
+        count = int(dp[goal])
+    else:
+        dp = [0] * (goal + 1)
+        dp[0] = 1
+        for a in values:
+            reach = min(reach + a, goal)
+            dp[a:reach + 1] = [x + y for x, y in zip(dp[a:reach + 1], dp)]
+        count = dp[goal]
+
+    # 0 은 + 로 붙이든 - 로 붙이든 합이 같으므로 방법 수가 두 배가 된다.
+    return count << zeros
+
+
+def subset_sum_counts(array, limit):
+    # limit 이하인 부분집합 합마다 만드는 방법의 수
+    counts = Counter({0: 1})
+    for a in array:
+        next_counts = counts.copy()
+        for s, c in counts.items():
+            if s + a <= limit:
+                next_counts[s + a] += c
+        counts = next_counts
+    return counts
+
+
+def count_subsets_meet_in_the_middle(array, goal):
+    # 절반씩 나눠 각각 가능한 합(최대 2^(N/2) 개)을 구하고, 두 합이 goal 이 되는 쌍을 센다.
+    half = len(array) // 2
+    left = subset_sum_counts(array[:half], goal)
+    right = subset_sum_counts(array[half:], goal)
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(c * right.get(goal - s, 0) for s, c in left.items())
+
+
+def get_count_of_ways_to_target_by_doing_plus_or_minus(array, target):
+    goal = subset_target(array, target)
+    if goal is None:
+        return 0
+    # 합이 goal 인 부분집합과 그 여집합(합 S - goal)은 하나씩 짝지어지므로 더 작은 쪽을 센다.
+    goal = min(goal, sum(array) - goal)
+    if (goal + 1) * len(array) <= DP_BUDGET:
+        return count_subsets_dp(array, goal)
+    if len(array) <= MEET_IN_THE_MIDDLE_LIMIT:
+        return count_subsets_meet_in_the_middle(array, goal)
+    # 숫자가 많고 값도 큰 경우: 실제로 만들어지는 합만 사전에 담아 센다.
+    return subset_sum_counts(array, goal)[goal]
+
+
+print(get_count_of_ways_to_target_by_doing_plus_or_minus(numbers, target_number))  # 5를 반환해야 합니다!
+
+print("정답 = 5 / 현재 풀이 값 = ", count_subsets_meet_in_the_middle(numbers, subset_target(numbers, target_number)))
+print("정답 = 2 / 현재 풀이 값 = ", get_count_of_ways_to_target_by_doing_plus_or_minus([0, 1], 1))
+print("정답 = 0 / 현재 풀이 값 = ", get_count_of_ways_to_target_by_doing_plus_or_minus([2, 2], 1))
+# 1 이 3000개이고 타겟이 0 이면 답은 C(3000, 1500) 으로 902 자리 수다.
+print("정답 = 902 / 현재 풀이 값 = ",
+      len(str(get_count_of_ways_to_target_by_doing_plus_or_minus([1] * 3000, 0))))
@@ -0,0 +1,258 @@
+# 외부 정렬 - 메모리보다 큰 파일을 병합 정렬하기
+#
+# 03_04 의 merge 는 두 리스트가 모두 메모리에 있어야 한다.
+# 몇 GB 짜리 파일은 한 번에 읽을 수 없으므로
+#   1) 메모리에 들어가는 만큼(chunk)씩 읽어 정렬한 뒤 임시 파일(run)로 내보내고
+#   2) run 들의 맨 앞 값만 힙에 넣어 가장 작은 값을 하나씩 꺼내는 k-way merge 를 한다.
+# 한 번에 메모리에 있는 것은 chunk 하나, 또는 run 마다 읽기 버퍼 하나씩뿐이다.
+#
+# 메모리 예산(memory_bytes)
+# - run 을 만들 때: 파이썬에서 정렬하려면 8바이트 정수 하나가 int 객체(약 32~40바이트)와
+#   리스트 칸(8바이트)이 된다. 그래서 chunk 는 memory_bytes 바이트가 아니라
+#   memory_bytes // (ITEM_SIZE + SORT_OVERHEAD) 개씩 읽는다.
+# - 합칠 때: 읽기 버퍼와 쓰기 버퍼를 합쳐 memory_bytes 로 나눠 쓴다.
+#   (정수 200만 개, memory_bytes=4MB 일 때 tracemalloc 최대치 약 4.05MB)
+# - 레코드 파일은 줄 길이가 제각각이라 memory_bytes 를 읽어 들일 줄의 바이트 수로만 쓴다.
+#   줄마다 bytes 객체와 리스트 칸(약 40바이트)이 더 붙는다.
+#
+# - 정수 파일: 8바이트 정수(array 'q')를 그대로 이어 붙인 이진 파일. run 도 같은 형식으로 쓴다.
+# - 레코드 파일: 한 줄이 레코드 하나인 텍스트 파일. 바이트 단위로 비교한다.
+# - run 이 너무 많으면 fan_in 개씩 여러 번 나눠 합친다.
+
+import heapq
+import mmap
+import os
+import random
+import shutil
+import tempfile
+import time
+from array import array
+
+MB = 1024 * 1024
+ITEM_SIZE = array("q").itemsize
+# 정렬하는 동안 정수 하나에 더 드는 메모리: int 객체 + 리스트 칸
+SORT_OVERHEAD = 48
+
+
+def check_arguments(memory_bytes, fan_in, minimum):
+    # fan_in 이 1 이면 run 수가 줄지 않아 끝나지 않는다.
+    if fan_in < 2:
+        raise ValueError("fan_in 은 2 이상이어야 합니다.")
+    if memory_bytes < minimum:
+        raise ValueError(f"memory_bytes 는 {minimum} 바이트 이상이어야 합니다.")
+
+
+class Stats:
+    def __init__(self):
+        self.bytes = 0
+        self.runs = 0
+        self.started = time.perf_counter()
+        self.phases = []
+
+    def phase(self, name, size):
+        now = time.perf_counter()
+        elapsed = now - self.started
+        self.phases.append((name, size / MB / elapsed if elapsed else 0.0, elapsed))
+        self.started = now
+
+    def report(self):
+        for name, speed, elapsed in self.phases:
+            print(f"  {name:<6} {elapsed:6.2f}초  {speed:8.1f} MB/s")
+
+
+# ----- 정수 파일 -----
+
+def read_int_chunks(path, chunk_bytes, use_mmap=True):
+    # chunk_bytes 만큼씩 정수를 읽는다. 정수 경계에 맞춰 자른다.
+    chunk_bytes -= chunk_bytes % ITEM_SIZE
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        if use_mmap and size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, chunk_bytes):
+                        chunk = array("q")
+                        # memoryview 로 잘라야 중간에 bytes 복사본이 생기지 않는다.
+                        chunk.frombytes(view[offset:offset + chunk_bytes])
+                        yield chunk
+                finally:
+                    view.release()
+        else:
+            while True:
+                # read() 로 bytes 를 받은 뒤 옮기면 잠깐 두 배가 필요하므로 배열에 바로 읽는다.
+                chunk = array("q", [0]) * (chunk_bytes // ITEM_SIZE)
+                read = file.readinto(chunk) // ITEM_SIZE
+                if not read:
+                    break
+                del chunk[read:]
+                yield chunk
+
+
+def iter_int_run(path, buffer_bytes):
+    # run 파일을 buffer_bytes 씩 읽어 정수를 하나씩 내보낸다.
+    # 버퍼 하나를 만들어 두고 readinto 로 계속 덮어쓰므로 읽을 때마다 새로 할당하지 않는다.
+    block = array("q", [0]) * max(1, buffer_bytes // ITEM_SIZE)
+    view = memoryview(block)
+    with open(path, "rb") as file:
+        while True:
+            read = file.readinto(block) // ITEM_SIZE
+            if not read:
+                break
+            yield from view[:read]
+    view.release()
+
+
+def write_ints(values, path, buffer_bytes):
+    # 크기가 정해진 버퍼를 채울 때마다 파일로 내보낸다.
+    count = max(1, buffer_bytes // ITEM_SIZE)
+    block = array("q", [0]) * count
+    view = memoryview(block)
+    filled = 0
+    with open(path, "wb") as file:
+        for value in values:
+            block[filled] = value
+            filled += 1
+            if filled == count:
+                file.write(view)
+                filled = 0
+        file.write(view[:filled])
+    view.release()
+
+
+def external_sort_ints(input_path, output_path, memory_bytes=64 * MB, fan_in=64, use_mmap=True, tmp_dir=None):
+    check_arguments(memory_bytes, fan_in, ITEM_SIZE + SORT_OVERHEAD)
+    stats = Stats()
+    size = os.path.getsize(input_path)
+    workdir = tempfile.mkdtemp(prefix="external-sort-", dir=tmp_dir)
+    try:
+        # 1) 정렬된 run 만들기. 정렬용 리스트까지 memory_bytes 에 들어가도록 chunk 를 잡는다.
+        chunk_bytes = memory_bytes // (ITEM_SIZE + SORT_OVERHEAD) * ITEM_SIZE
+        runs = []
+        for chunk in read_int_chunks(input_path, chunk_bytes, use_mmap):
+            values = chunk.tolist()
+            del chunk
+            values.sort()
+            path = os.path.join(workdir, f"run-{len(runs)}.bin")
+            # 리스트를 통째로 array 로 바꾸지 않고 작은 버퍼로 나눠 쓴다.
+            write_ints(values, path, 64 * 1024)
+            del values
+            runs.append(path)
+        stats.runs = len(runs)
+        stats.phase("run", size)
+
+        # 2) k-way merge. 읽기 버퍼(run 마다 하나)와 쓰기 버퍼가 memory_bytes 를 나눠 쓴다.
+        passes = 0
+        while len(runs) > 1:
+            passes += 1
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                buffer_bytes = memory_bytes // (len(group) + 1)
+                last_pass = len(runs) <= fan_in
+                path = output_path if last_pass else os.path.join(workdir, f"merge-{passes}-{start}.bin")
+                write_ints(heapq.merge(*(iter_int_run(run, buffer_bytes) for run in group)), path, buffer_bytes)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+        if len(runs) == 1 and runs[0] != output_path:
+            shutil.move(runs[0], output_path)
+        elif not runs:
+            open(output_path, "wb").close()
+        stats.phase("merge", size * max(passes, 1))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return stats
+
+
+# ----- 레코드(줄) 파일 -----
+
+def read_line_chunks(path, chunk_bytes):
+    with open(path, "rb") as file:
+        while True:
+            lines = file.readlines(chunk_bytes)
+            if not lines:
+                break
+            # 마지막 줄에 줄바꿈이 없으면 붙여서 run 에서 다른 줄과 붙지 않게 한다.
+            if not lines[-1].endswith(b"\n"):
+                lines[-1] += b"\n"
+            yield lines
+
+
+def external_sort_lines(input_path, output_path, memory_bytes=64 * MB, fan_in=64, tmp_dir=None):
+    # readlines(0) 은 파일 전체를 읽으므로 0 이하는 받지 않는다.
+    check_arguments(memory_bytes, fan_in, 1)
+    stats = Stats()
+    size = os.path.getsize(input_path)
+    workdir = tempfile.mkdtemp(prefix="external-sort-", dir=tmp_dir)
+    try:
+        runs = []
+        for lines in read_line_chunks(input_path, memory_bytes):
+            lines.sort()
+            path = os.path.join(workdir, f"run-{len(runs)}.txt")
+            with open(path, "wb") as file:
+                file.writelines(lines)
+            runs.append(path)
+        stats.runs = len(runs)
+        stats.phase("run", size)
+
+        passes = 0
+        while len(runs) > 1:
+            passes += 1
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                buffer_bytes = memory_bytes // (len(group) + 1)
+                path = output_path if len(runs) <= fan_in else os.path.join(workdir, f"merge-{passes}-{start}.txt")
+                files = [open(run, "rb", buffering=buffer_bytes) for run in group]
+                try:
+                    with open(path, "wb", buffering=buffer_bytes) as output:
+                        output.writelines(heapq.merge(*files))
+                finally:
+                    for file in files:
+                        file.close()
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+        if len(runs) == 1 and runs[0] != output_path:
+            shutil.move(runs[0], output_path)
+        elif not runs:
+            open(output_path, "wb").close()
+        stats.phase("merge", size * max(passes, 1))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return stats
+
+
+if __name__ == "__main__":
+    workdir = tempfile.mkdtemp(prefix="external-sort-demo-")
+    try:
+        # 정수 500만 개(약 40MB)를 메모리 4MB 로 정렬
+        source = os.path.join(workdir, "ints.bin")
+        values = array("q", (random.randrange(-2**62, 2**62) for _ in range(5_000_000)))
+        with open(source, "wb") as file:
+            values.tofile(file)
+        target = os.path.join(workdir, "ints.sorted.bin")
+        stats = external_sort_ints(source, target, memory_bytes=4 * MB, fan_in=8)
+        result = array("q")
+        with open(target, "rb") as file:
+            result.frombytes(file.read())
+        print("정수", len(values), "개, run", stats.runs, "개 / 정렬 결과 일치 = ", list(result) == sorted(values))
+        stats.report()
+
+        # 레코드 100만 줄
+        source = os.path.join(workdir, "records.txt")
+        with open(source, "wb") as file:
+            for index in range(1_000_000):
+                file.write(f"{random.randrange(10**9):09d},user{index}\n".encode())
+        target = os.path.join(workdir, "records.sorted.txt")
+        stats = external_sort_lines(source, target, memory_bytes=2 * MB, fan_in=8)
+        with open(source, "rb") as file:
+            expected = sorted(file.readlines())
+        with open(target, "rb") as file:
+            print("레코드 100만 줄, run", stats.runs, "개 / 정렬 결과 일치 = ", file.readlines() == expected)
+        stats.report()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
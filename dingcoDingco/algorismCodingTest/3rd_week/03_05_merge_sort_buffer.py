@@ -0,0 +1,194 @@
+# 병합 정렬 - 보조 배열 하나로 정렬하기
+#
+# 03_05 풀이는 재귀마다 array[:mid], array[mid:] 로 잘라 새 배열을 만들고,
+# merge 마다 result 를 새로 만들어서 전체적으로 O(N log N) 만큼 메모리를 할당한다.
+#
+# - 원래 배열과 같은 크기의 보조 배열(buffer)을 처음에 한 번만 만들고 계속 재사용한다.
+#   buffer[lo:mid] = array[lo:mid] 같은 슬라이스 대입은 오른쪽에서 임시 리스트를 만들므로
+#   값 옮기기는 모두 인덱스 반복문으로 한다. 그래서 buffer 말고는 정렬 중에 새 리스트를
+#   만들지 않는다. (parallel_merge_sort 는 프로세스로 넘길 조각을 따로 만든다.)
+# - top-down 은 단계마다 array 와 buffer 의 역할을 바꿔(ping-pong) 한쪽에서 다른 쪽으로
+#   바로 합치므로 합치기 전에 복사할 필요가 없다.
+# - bottom-up 은 왼쪽 구간만 buffer 로 옮긴 뒤 array 에 제자리로 합친다.
+# - 작은 구간(RUN 이하)은 삽입 정렬이 더 빠르다.
+# - 왼쪽 구간의 마지막 값 <= 오른쪽 구간의 첫 값이면 이미 정렬된 것이므로 병합을 건너뛴다.
+#   (top-down 은 반대쪽 배열로 옮기기만 한다.)
+# - 재귀 없이 구간 크기를 RUN, 2RUN, 4RUN ... 으로 키워 가는 bottom-up 방식도 만든다.
+# - 큰 배열은 여러 프로세스에서 조각별로 정렬한 뒤 heapq.merge 로 한 번에 합친다(k-way merge).
+
+import heapq
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+array = [5, 3, 2, 1, 6, 8, 7, 4]
+
+RUN = 32
+
+
+def insertion_sort(array, lo, hi):
+    # array[lo:hi] 를 제자리에서 정렬한다. 같은 값은 순서를 유지한다.
+    for i in range(lo + 1, hi):
+        value = array[i]
+        j = i - 1
+        while j >= lo and array[j] > value:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = value
+
+
+def copy_range(source, target, lo, hi):
+    # target[lo:hi] = source[lo:hi] 와 같지만 임시 리스트를 만들지 않는다.
+    for i in range(lo, hi):
+        target[i] = source[i]
+
+
+def merge_into(source, target, lo, mid, hi):
+    # 정렬된 source[lo:mid] 와 source[mid:hi] 를 target[lo:hi] 로 합친다.
+    if source[mid - 1] <= source[mid]:
+        copy_range(source, target, lo, hi)  # 이미 순서대로다
+        return
+    left, right, out = lo, mid, lo
+    while left < mid and right < hi:
+        if source[left] <= source[right]:  # 같으면 왼쪽 먼저 -> 안정 정렬
+            target[out] = source[left]
+            left += 1
+        else:
+            target[out] = source[right]
+            right += 1
+        out += 1
+    # 한쪽이 먼저 끝나면 남은 쪽을 그대로 옮긴다.
+    while left < mid:
+        target[out] = source[left]
+        left += 1
+        out += 1
+    while right < hi:
+        target[out] = source[right]
+        right += 1
+        out += 1
+
+
+def merge_runs(array, buffer, lo, mid, hi):
+    # 정렬된 array[lo:mid] 와 array[mid:hi] 를 array 안에서 합친다.
+    if array[mid - 1] <= array[mid]:
+        return  # 이미 순서대로다
+
+    # 왼쪽 구간만 buffer 로 옮겨 두면, 오른쪽 구간은 제자리에서 읽으면서 앞에서부터 채울 수 있다.
+    copy_range(array, buffer, lo, mid)
+    left, right, out = lo, mid, lo
+    while left < mid and right < hi:
+        if buffer[left] <= array[right]:  # 같으면 왼쪽 먼저 -> 안정 정렬
+            array[out] = buffer[left]
+            left += 1
+        else:
+            array[out] = array[right]
+            right += 1
+        out += 1
+    # 남은 왼쪽 구간을 옮긴다. 오른쪽이 남았다면 이미 제자리에 있다.
+    while left < mid:
+        array[out] = buffer[left]
+        left += 1
+        out += 1
+
+
+def merge_sort(array):
+    # 위에서 아래로(top-down) 나누는 방식. 제자리에서 정렬하고 array 를 돌려준다.
+    # buffer 도 같은 값으로 시작해야 어느 쪽을 정렬 대상으로 써도 된다.
+    buffer = array[:]
+
+    def sort(source, target, lo, hi):
+        # source[lo:hi] 를 보조로 쓰면서 target[lo:hi] 를 정렬한다.
+        if hi - lo <= RUN:
+            insertion_sort(target, lo, hi)
+            return
+        mid = (lo + hi) // 2
+        # 두 반쪽은 source 에 정렬해 두고, target 으로 합친다.
+        sort(target, source, lo, mid)
+        sort(target, source, mid, hi)
+        merge_into(source, target, lo, mid, hi)
+
+    sort(buffer, array, 0, len(array))
+    return array
+
+
+def merge_sort_bottom_up(array):
+    # 아래에서 위로(bottom-up) 합치는 방식. 재귀가 없다.
+    n = len(array)
+    for lo in range(0, n, RUN):
+        insertion_sort(array, lo, min(lo + RUN, n))
+
+    buffer = [None] * n
+    width = RUN
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            merge_runs(array, buffer, lo, lo + width, min(lo + 2 * width, n))
+        width *= 2
+    return array
+
+
+def parallel_merge_sort(array, workers=4):
+    # 조각마다 다른 프로세스에서 정렬한 뒤, 정렬된 조각들을 한 번에 합친다.
+    if len(array) < workers * RUN:
+        return merge_sort(array)
+    size = -(-len(array) // workers)
+    chunks = [array[start:start + size] for start in range(0, len(array), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        sorted_chunks = list(executor.map(merge_sort_bottom_up, chunks))
+    array[:] = heapq.merge(*sorted_chunks)
+    return array
+
+
+# 03_05 풀이 (비교용)
+def merge_sort_original(array):
+    if len(array) <= 1:
+        return array
+    mid = len(array) // 2
+    return merge_original(merge_sort_original(array[:mid]), merge_sort_original(array[mid:]))
+
+
+def merge_original(array1, array2):
+    result = []
+    i = j = 0
+    while i < len(array1) and j < len(array2):
+        if array1[i] < array2[j]:
+            result.append(array1[i])
+            i += 1
+        else:
+            result.append(array2[j])
+            j += 1
+    result.extend(array1[i:])
+    result.extend(array2[j:])
+    return result
+
+
+if __name__ == "__main__":
+    print(merge_sort(array[:]))  # [1, 2, 3, 4, 5, 6, 7, 8] 가 되어야 합니다!
+
+    for sort in (merge_sort, merge_sort_bottom_up, parallel_merge_sort):
+        print(sort.__name__)
+        print("정답 = [-7, -1, 5, 6, 9, 10, 11, 40] / 현재 풀이 값 = ", sort([-7, -1, 9, 40, 5, 6, 10, 11]))
+        print("정답 = [-1, 2, 3, 5, 10, 40, 78, 100] / 현재 풀이 값 = ", sort([-1, 2, 3, 5, 40, 10, 78, 100]))
+        print("정답 = [-1, -1, 0, 1, 6, 9, 10] / 현재 풀이 값 = ", sort([-1, -1, 0, 1, 6, 9, 10]))
+
+    # 속도 비교
+    data = [random.random() for _ in range(1_000_000)]
+    candidates = [
+        ("03_05 풀이", merge_sort_original),
+        ("merge_sort (buffer)", merge_sort),
+        ("merge_sort_bottom_up", merge_sort_bottom_up),
+        ("parallel_merge_sort", parallel_merge_sort),
+        ("sorted()", sorted),
+    ]
+    expected = sorted(data)
+    for name, sort in candidates:
+        values = data[:]
+        start = time.perf_counter()
+        result = sort(values)
+        elapsed = time.perf_counter() - start
+        assert result == expected, name
+        print(f"{name:<22} {elapsed:.2f}초")
+
+    # 이미 정렬된 입력은 병합을 모두 건너뛴다.
+    start = time.perf_counter()
+    merge_sort_bottom_up(expected)
+    print(f"{'정렬된 입력 (bottom-up)':<22} {time.perf_counter() - start:.2f}초")
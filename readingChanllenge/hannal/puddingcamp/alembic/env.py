@@ -4,10 +4,7 @@ from logging.config import fileConfig
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from appserver.apps.account import models   #noqa
-from appserver.apps.calendar import models  #noqa
-from sqlmodel import SQLModel
-from appserver.db import DSN
+from appserver.settings import settings
 from alembic import context
 
 # this is the Alembic Config object, which provides
@@ -19,11 +16,51 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+DSN = settings.dsn
+
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-target_metadata = SQLModel.metadata
+def needs_target_metadata() -> bool:
+    """모델 비교가 필요한 명령에서만 모델을 import 한다.
+
+    upgrade/downgrade 는 마이그레이션 스크립트만 실행하므로 모델 정의가 필요 없다.
+    """
+    cmd_opts = config.cmd_opts
+    if cmd_opts is None or not hasattr(cmd_opts, "cmd"):
+        return True
+    command = cmd_opts.cmd[0].__name__
+    return command == "check" or getattr(cmd_opts, "autogenerate", False)
+
+
+def load_target_metadata():
+    if not needs_target_metadata():
+        return None
+    from appserver.apps.account import models   #noqa
+    from appserver.apps.calendar import models  #noqa
+    from sqlmodel import SQLModel
+    return SQLModel.metadata
+
+
+target_metadata = load_target_metadata()
+
+
+def include_name(name, type_, parent_names) -> bool:
+    # backfill 진행 기록용 테이블은 모델에 없으므로 비교에서 뺀다.
+    if type_ == "table":
+        return name != "alembic_backfill_progress"
+    return True
+
+
+# SQLite 는 ALTER TABLE 을 거의 지원하지 않으므로 batch 모드로 만들고,
+# 마이그레이션마다 따로 커밋해 긴 backfill 이 앞선 변경까지 붙잡지 않게 한다.
+migration_options = {
+    "render_as_batch": True,
+    "transaction_per_migration": True,
+    "include_name": include_name,
+}
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -49,6 +86,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        **migration_options,
     )
 
     with context.begin_transaction():
@@ -56,7 +94,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, **migration_options)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,29 @@
+"""add bookings.version
+
+Revision ID: 2a8f6e0d4c17
+Revises: e5f04c7b1a92
+Create Date: 2026-10-18 11:52:40.871553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a8f6e0d4c17'
+down_revision: Union[str, Sequence[str], None] = 'e5f04c7b1a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bookings', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,69 @@
+"""add time_slots.weekday_mask
+
+Revision ID: 4b1e7d2a9f30
+Revises: c72dad9c146c
+Create Date: 2026-10-18 09:40:51.604127
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from appserver.backfill import add_column_if_missing, backfill
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1e7d2a9f30'
+down_revision: Union[str, Sequence[str], None] = 'c72dad9c146c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def weekday_mask(row) -> dict:
+    weekdays = row.weekdays
+    if isinstance(weekdays, str):
+        weekdays = json.loads(weekdays)
+    mask = 0
+    for weekday in weekdays or []:
+        mask |= 1 << weekday
+    return {"weekday_mask": mask}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    add_column_if_missing(
+        'time_slots',
+        sa.Column('weekday_mask', sa.Integer(), server_default='0', nullable=False),
+    )
+
+    time_slots = sa.table(
+        'time_slots',
+        sa.column('id', sa.Integer()),
+        sa.column('weekdays', sa.JSON()),
+        sa.column('weekday_mask', sa.Integer()),
+    )
+    # 배치마다 커밋해 time_slots 를 오래 잠그지 않는다.
+    with op.get_context().autocommit_block():
+        backfill(
+            op.get_bind(),
+            time_slots,
+            weekday_mask,
+            name='time_slots.weekday_mask',
+            columns=['weekdays'],
+        )
+
+    op.create_index(
+        'ix_time_slots_calendar_id_weekday_mask_start_time',
+        'time_slots',
+        ['calendar_id', 'weekday_mask', 'start_time'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_time_slots_calendar_id_weekday_mask_start_time', table_name='time_slots')
+    with op.batch_alter_table('time_slots') as batch_op:
+        batch_op.drop_column('weekday_mask')
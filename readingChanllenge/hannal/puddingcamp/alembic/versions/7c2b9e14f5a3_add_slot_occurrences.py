@@ -0,0 +1,50 @@
+"""add slot_occurrences and calendars.timezone
+
+Revision ID: 7c2b9e14f5a3
+Revises: 2a8f6e0d4c17
+Create Date: 2026-10-18 12:38:06.417285
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy_utc
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2b9e14f5a3'
+down_revision: Union[str, Sequence[str], None] = '2a8f6e0d4c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'calendars',
+        sa.Column('timezone', sqlmodel.sql.sqltypes.AutoString(length=64), server_default='UTC', nullable=False),
+    )
+    op.create_table('slot_occurrences',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('time_slot_id', sa.Integer(), nullable=False),
+    sa.Column('calendar_id', sa.Integer(), nullable=False),
+    sa.Column('local_date', sa.Date(), nullable=False),
+    sa.Column('starts_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.Column('ends_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['time_slot_id'], ['time_slots.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('time_slot_id', 'local_date', name='uq_time_slot_id_local_date')
+    )
+    op.create_index('ix_slot_occurrences_calendar_id_starts_at', 'slot_occurrences', ['calendar_id', 'starts_at'], unique=False)
+    # 기존 시간대의 일정은 앱이 시작하면서 refresh_horizon 으로 채운다.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_slot_occurrences_calendar_id_starts_at', table_name='slot_occurrences')
+    op.drop_table('slot_occurrences')
+    with op.batch_alter_table('calendars') as batch_op:
+        batch_op.drop_column('timezone')
@@ -0,0 +1,30 @@
+"""add unique constraint on bookings (time_slot_id, when)
+
+Revision ID: 9d3c5a61e2b8
+Revises: 4b1e7d2a9f30
+Create Date: 2026-10-18 10:27:13.552940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3c5a61e2b8'
+down_revision: Union[str, Sequence[str], None] = '4b1e7d2a9f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.create_unique_constraint('uq_time_slot_id_when', ['time_slot_id', 'when'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('bookings') as batch_op:
+        batch_op.drop_constraint('uq_time_slot_id_when', type_='unique')
@@ -0,0 +1,28 @@
+"""add oauth_accounts.user_id index
+
+Revision ID: b3d81f6c0e29
+Revises: 7c2b9e14f5a3
+Create Date: 2026-10-18 15:20:11.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d81f6c0e29'
+down_revision: Union[str, Sequence[str], None] = '7c2b9e14f5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_oauth_accounts_user_id'), 'oauth_accounts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_oauth_accounts_user_id'), table_name='oauth_accounts')
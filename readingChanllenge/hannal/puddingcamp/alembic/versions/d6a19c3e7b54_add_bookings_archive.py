@@ -0,0 +1,48 @@
+"""add bookings_archive
+
+Revision ID: d6a19c3e7b54
+Revises: b3d81f6c0e29
+Create Date: 2026-10-18 16:02:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy_utc
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a19c3e7b54'
+down_revision: Union[str, Sequence[str], None] = 'b3d81f6c0e29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('bookings_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('when', sa.Date(), nullable=False),
+    sa.Column('topic', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('time_slot_id', sa.Integer(), nullable=False),
+    sa.Column('guest_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sqlalchemy_utc.sqltypes.UtcDateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    sa.ForeignKeyConstraint(['guest_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['time_slot_id'], ['time_slots.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_bookings_archive_guest_id_when_id', 'bookings_archive', ['guest_id', 'when', 'id'], unique=False)
+    op.create_index('ix_bookings_archive_time_slot_id_when_id', 'bookings_archive', ['time_slot_id', 'when', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_archive_time_slot_id_when_id', table_name='bookings_archive')
+    op.drop_index('ix_bookings_archive_guest_id_when_id', table_name='bookings_archive')
+    op.drop_table('bookings_archive')
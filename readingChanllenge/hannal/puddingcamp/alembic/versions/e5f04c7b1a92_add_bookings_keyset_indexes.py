@@ -0,0 +1,30 @@
+"""add keyset pagination indexes on bookings
+
+Revision ID: e5f04c7b1a92
+Revises: 9d3c5a61e2b8
+Create Date: 2026-10-18 11:05:37.209846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f04c7b1a92'
+down_revision: Union[str, Sequence[str], None] = '9d3c5a61e2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookings_guest_id_when_id', 'bookings', ['guest_id', 'when', 'id'], unique=False)
+    op.create_index('ix_bookings_time_slot_id_when_id', 'bookings', ['time_slot_id', 'when', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_time_slot_id_when_id', table_name='bookings')
+    op.drop_index('ix_bookings_guest_id_when_id', table_name='bookings')
@@ -0,0 +1,28 @@
+"""add bookings (when, id) index
+
+Revision ID: f2c87a5d1b63
+Revises: d6a19c3e7b54
+Create Date: 2026-10-18 18:41:05.873120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c87a5d1b63'
+down_revision: Union[str, Sequence[str], None] = 'd6a19c3e7b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bookings_when_id', 'bookings', ['when', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bookings_when_id', table_name='bookings')
@@ -1,7 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from appserver.apps.account.passwords import password_hasher
+from appserver.apps.calendar.archive import archive_periodically
+from appserver.apps.calendar.endpoints import router as calendar_router
+from appserver.apps.calendar.google_sync import google_calendar_sync
+from appserver.apps.calendar.occurrences import refresh_periodically
+from appserver.db import database
+from appserver.metrics import PerformanceMiddleware, registry
+from appserver.responses import default_response_class
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    database.connect()
+    occurrence_refresher = asyncio.create_task(refresh_periodically())
+    booking_archiver = asyncio.create_task(archive_periodically())
+    await google_calendar_sync.start()
+    yield
+    await google_calendar_sync.stop()
+    for task in (occurrence_refresher, booking_archiver):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hasher.shutdown()
+    await database.dispose()
+
 
-app = FastAPI()
+app_options = {"lifespan": lifespan}
+if (response_class := default_response_class()) is not None:
+    app_options["default_response_class"] = response_class
+
+app = FastAPI(**app_options)
+
+app.add_middleware(PerformanceMiddleware)
+
+app.include_router(calendar_router)
 
 @app.get("/")
 def hello_world() -> dict:
-    return {"message": "Hello World"}
\ No newline at end of file
+    return {"message": "Hello World"}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> str:
+    return registry.render()
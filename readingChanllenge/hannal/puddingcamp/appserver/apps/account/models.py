@@ -22,7 +22,7 @@ class User(SQLModel, table=True):
     password: str = Field(max_length=128, description="사용자 비밀번호")
     is_host: bool = Field(default=False, description="사용자가 호스트인지 여부")
 
-    oauth_accounts: list["OauthAccount"] = Relationship(back_populates="user")
+    oauth_accounts: list["OAuthAccount"] = Relationship(back_populates="user")
     calendar: "Calendar" = Relationship(
         back_populates="host",
         sa_relationship_kwargs={"uselist": False, "single_parent": True},
@@ -45,7 +45,7 @@ class OAuthAccount(SQLModel, table=True):
     provider: str = Field(max_length=10, description="OAuth 제공자")
     provider_account_id: str = Field(max_length=128, description="OAuth 제공자 계정 ID")
     
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     user: User = Relationship(back_populates="oauth_accounts")
 
     created_at: AwareDatetime = Field(
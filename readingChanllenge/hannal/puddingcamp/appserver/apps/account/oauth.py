@@ -0,0 +1,147 @@
+import asyncio
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from appserver.apps.account.models import OAuthAccount, User
+from appserver.cache import LRUCache
+from appserver.settings import settings
+
+# 없는 계정을 캐시했다는 표시. LRUCache 는 없는 키에 None 을 돌려주므로 따로 둔다.
+_NOT_LINKED = object()
+_PENDING_KEY = "changed_oauth_accounts"
+
+oauth_cache = LRUCache(maxsize=settings.oauth_cache_maxsize, ttl=settings.oauth_cache_ttl)
+_inflight: dict[str, asyncio.Future] = {}
+# 커밋 후 캐시를 지울 때마다 1씩 늘린다. 조회하는 사이에 바뀌었으면 읽은 값이 이미 낡았을 수 있다.
+_generation = 0
+
+
+@dataclass(frozen=True, slots=True)
+class OAuthLogin:
+    """OAuth 로그인에 필요한 사용자 정보. 세션과 무관하게 캐시에 둘 수 있다."""
+    user_id: int
+    username: str
+    email: str
+    display_name: str
+    is_host: bool
+
+
+def oauth_key(provider: str, provider_account_id: str) -> str:
+    return f"oauth:{provider}:{provider_account_id}"
+
+
+async def _load_oauth_login(session: AsyncSession, provider: str, provider_account_id: str) -> OAuthLogin | None:
+    # uq_provider_provider_account_id 인덱스로 계정을 찾고 사용자까지 한 번에 읽는다.
+    row = (await session.execute(
+        select(User.id, User.username, User.email, User.display_name, User.is_host)
+        .join(OAuthAccount, OAuthAccount.user_id == User.id)
+        .where(
+            OAuthAccount.provider == provider,
+            OAuthAccount.provider_account_id == provider_account_id,
+        )
+    )).one_or_none()
+    return OAuthLogin(*row) if row is not None else None
+
+
+async def find_oauth_login(session: AsyncSession, provider: str, provider_account_id: str) -> OAuthLogin | None:
+    """OAuth 제공자 계정에 연결된 사용자를 찾는다.
+
+    찾은 결과와 찾지 못한 결과를 모두 짧게 캐시하고,
+    같은 계정에 대한 동시 조회는 하나의 쿼리로 합친다.
+    """
+    key = oauth_key(provider, provider_account_id)
+    cached = oauth_cache.get_nowait(key)
+    if cached is not None:
+        return None if cached is _NOT_LINKED else cached
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # 먼저 조회하던 요청이 취소된 경우에만 직접 조회한다.
+            if not inflight.cancelled():
+                raise
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    generation = _generation
+    try:
+        login = await _load_oauth_login(session, provider, provider_account_id)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # 기다리는 쪽이 없으면 예외가 회수되지 않았다는 경고가 나므로 미리 꺼내 둔다.
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+    # 조회 중에 다른 트랜잭션이 계정을 연결하고 커밋했다면, 캐시를 지운 뒤에
+    # 낡은 결과를 다시 넣게 되므로 이번 결과는 캐시하지 않는다.
+    if generation == _generation:
+        if login is None:
+            oauth_cache.set_nowait(key, _NOT_LINKED, ttl=settings.oauth_negative_cache_ttl)
+        else:
+            oauth_cache.set_nowait(key, login)
+    future.set_result(login)
+    return login
+
+
+async def get_oauth_accounts(session: AsyncSession, user_id: int) -> list[OAuthAccount]:
+    """사용자에게 연결된 OAuth 계정들. ix_oauth_accounts_user_id 를 탄다."""
+    return list((await session.scalars(
+        select(OAuthAccount).where(OAuthAccount.user_id == user_id).order_by(OAuthAccount.id)
+    )).all())
+
+
+def mark_oauth_account_changed(session: Session | None, provider: str, provider_account_id: str) -> None:
+    if session is None:
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add(oauth_key(provider, provider_account_id))
+
+
+@event.listens_for(OAuthAccount, "after_insert")
+@event.listens_for(OAuthAccount, "after_update")
+@event.listens_for(OAuthAccount, "after_delete")
+def oauth_account_changed(mapper, connection, target: OAuthAccount) -> None:
+    # 새로 연결한 계정이 음성 캐시에 남아 있으면 TTL 동안 로그인이 막히므로 반드시 지운다.
+    # 제공자 계정 ID 를 바꾼 경우에는 예전 키에 남은 캐시도 지워야 한다.
+    session = object_session(target)
+    state = inspect(target)
+    providers = {target.provider, *state.attrs.provider.history.deleted}
+    provider_account_ids = {target.provider_account_id, *state.attrs.provider_account_id.history.deleted}
+    for provider in providers:
+        for provider_account_id in provider_account_ids:
+            mark_oauth_account_changed(session, provider, provider_account_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def user_changed(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    rows = connection.execute(
+        select(OAuthAccount.provider, OAuthAccount.provider_account_id)
+        .where(OAuthAccount.user_id == target.id)
+    ).all()
+    for provider, provider_account_id in rows:
+        mark_oauth_account_changed(session, provider, provider_account_id)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_after_commit(session: Session) -> None:
+    global _generation
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys:
+        _generation += 1
+        oauth_cache.invalidate(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
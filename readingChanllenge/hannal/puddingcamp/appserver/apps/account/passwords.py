@@ -0,0 +1,117 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from appserver.settings import settings
+
+ALGORITHM = "scrypt"
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+
+@dataclass(frozen=True, slots=True)
+class ScryptParams:
+    n: int
+    r: int
+    p: int
+
+    @property
+    def maxmem(self) -> int:
+        # scrypt 가 실제로 쓰는 메모리는 128 * n * r * p 바이트 남짓이다.
+        return 256 * self.n * self.r * self.p
+
+
+def _b64encode(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+def _derive(password: str, salt: bytes, params: ScryptParams) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=params.n,
+        r=params.r,
+        p=params.p,
+        maxmem=params.maxmem,
+        dklen=HASH_BYTES,
+    )
+
+
+def hash_password(password: str, params: ScryptParams) -> str:
+    """scrypt$n$r$p$salt$hash 형식의 문자열을 만든다. 128자 안에 들어간다."""
+    salt = secrets.token_bytes(SALT_BYTES)
+    digest = _derive(password, salt, params)
+    return "$".join((ALGORITHM, str(params.n), str(params.r), str(params.p), _b64encode(salt), _b64encode(digest)))
+
+
+def parse_hash(encoded: str) -> tuple[ScryptParams, bytes, bytes] | None:
+    parts = encoded.split("$")
+    if len(parts) != 6 or parts[0] != ALGORITHM:
+        return None
+    try:
+        params = ScryptParams(int(parts[1]), int(parts[2]), int(parts[3]))
+        return params, base64.b64decode(parts[4]), base64.b64decode(parts[5])
+    except ValueError:
+        return None
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    parsed = parse_hash(encoded)
+    if parsed is None:
+        return False
+    params, salt, digest = parsed
+    return hmac.compare_digest(_derive(password, salt, params), digest)
+
+
+class PasswordHasher:
+    """비밀번호 해시 계산을 별도 스레드 풀에서 돌린다.
+
+    hashlib.scrypt 는 계산하는 동안 GIL 을 놓으므로 스레드만으로도
+    이벤트 루프를 막지 않고 여러 코어를 쓸 수 있다.
+    동시에 제출되는 작업 수는 워커 수로 제한해 풀 안의 대기열이 무한히 늘지 않게 한다.
+    """
+
+    def __init__(self, params: ScryptParams, workers: int = 4):
+        self.params = params
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def needs_rehash(self, encoded: str) -> bool:
+        parsed = parse_hash(encoded)
+        return parsed is None or parsed[0] != self.params
+
+    async def _run(self, func, *args):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.params)
+
+    async def verify(self, password: str, encoded: str) -> bool:
+        return await self._run(verify_password, password, encoded)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._slots = None
+
+
+password_hasher = PasswordHasher(
+    ScryptParams(settings.password_scrypt_n, settings.password_scrypt_r, settings.password_scrypt_p),
+    workers=settings.password_hash_workers,
+)
@@ -0,0 +1,61 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from appserver.apps.account.models import User
+from appserver.apps.account.passwords import PasswordHasher, password_hasher
+
+
+async def create_user(
+    session: AsyncSession,
+    *,
+    username: str,
+    email: str,
+    display_name: str,
+    password: str,
+    is_host: bool = False,
+    hasher: PasswordHasher = password_hasher,
+) -> User:
+    user = User(
+        username=username,
+        email=email,
+        display_name=display_name,
+        password=await hasher.hash(password),
+        is_host=is_host,
+    )
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def authenticate(
+    session: AsyncSession,
+    username: str,
+    password: str,
+    hasher: PasswordHasher = password_hasher,
+) -> User | None:
+    """아이디와 비밀번호를 확인하고 맞으면 사용자를 돌려준다.
+
+    저장된 해시의 비용 인자가 현재 설정과 다르면 이번에 받은 비밀번호로 다시 해시해 둔다.
+    """
+    user = await session.scalar(select(User).where(User.username == username))
+    if user is None:
+        # 없는 계정도 같은 시간이 걸리게 해 계정 존재 여부가 드러나지 않게 한다.
+        await hasher.hash(password)
+        return None
+    encoded = user.password
+    if not await hasher.verify(password, encoded):
+        return None
+
+    if hasher.needs_rehash(encoded):
+        rehashed = await hasher.hash(password)
+        # 다른 로그인이 먼저 바꿔 두었다면 덮어쓰지 않는다.
+        await session.execute(
+            update(User)
+            .where(User.id == user.id, User.password == encoded)
+            .values(password=rehashed)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        set_committed_value(user, "password", rehashed)
+    return user
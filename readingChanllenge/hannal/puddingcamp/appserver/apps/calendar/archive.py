@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.models import Booking, BookingArchive
+from appserver.apps.calendar.schemas import BookingOut
+from appserver.db import database
+from appserver.settings import settings
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_COLUMNS = (
+    "id", "when", "topic", "description", "time_slot_id", "guest_id",
+    "version", "created_at", "updated_at",
+)
+
+
+def archive_cutoff(today: date | None = None, days: int | None = None) -> date:
+    """이 날짜보다 이전 예약은 보관 테이블에 있을 수 있다.
+
+    기준일은 시간이 지날수록 늘어나기만 하므로, 오늘 기준일 이후만 보는 조회는
+    bookings_archive 를 읽지 않아도 된다.
+    """
+    today = today or datetime.now(timezone.utc).date()
+    days = settings.booking_archive_after_days if days is None else days
+    return today - timedelta(days=days)
+
+
+async def archive_bookings(
+    session: AsyncSession,
+    before: date | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """when 이 before 보다 이전인 예약을 bookings_archive 로 옮긴다.
+
+    (when, id) 순으로 batch_size 건씩 복사와 삭제를 한 트랜잭션으로 묶어 커밋하므로
+    bookings 를 오래 잠그지 않고, 중간에 멈춰도 이미 옮긴 건은 그대로 남는다.
+    """
+    before = before or archive_cutoff()
+    batch_size = batch_size or settings.booking_archive_batch_size
+    source = Booking.__table__
+    target = BookingArchive.__table__
+
+    moved = 0
+    while True:
+        ids = (await session.scalars(
+            select(Booking.id)
+            .where(Booking.when < before)
+            .order_by(Booking.when, Booking.id)
+            .limit(batch_size)
+        )).all()
+        if not ids:
+            break
+        await session.execute(
+            insert(target).from_select(
+                ARCHIVED_COLUMNS,
+                select(*(source.c[name] for name in ARCHIVED_COLUMNS)).where(source.c.id.in_(ids)),
+            )
+        )
+        await session.execute(delete(source).where(source.c.id.in_(ids)))
+        await session.commit()
+        moved += len(ids)
+        if len(ids) < batch_size:
+            break
+        # 다른 요청이 끼어들 수 있게 배치 사이에 루프를 양보한다.
+        await asyncio.sleep(0)
+
+    if moved:
+        logger.info("예약 %d건을 bookings_archive 로 옮겼습니다 (%s 이전).", moved, before)
+    return moved
+
+
+async def archive_periodically(interval: float | None = None) -> None:
+    interval = settings.booking_archive_interval if interval is None else interval
+    while True:
+        try:
+            async with database.session_factory() as session:
+                await archive_bookings(session)
+        except Exception:
+            logger.exception("예약 보관 처리에 실패했습니다.")
+        await asyncio.sleep(interval)
+
+
+def booking_rows(model):
+    """BookingOut 에 필요한 열만 고른다. bookings 와 bookings_archive 를 UNION ALL 할 때 쓴다."""
+    return select(
+        model.id, model.when, model.topic, model.description, model.time_slot_id, model.guest_id,
+    )
+
+
+def _range_query(model, start: date | None, end: date | None, guest_id: int | None, time_slot_id: int | None):
+    stmt = booking_rows(model)
+    if guest_id is not None:
+        stmt = stmt.where(model.guest_id == guest_id)
+    if time_slot_id is not None:
+        stmt = stmt.where(model.time_slot_id == time_slot_id)
+    if start is not None:
+        stmt = stmt.where(model.when >= start)
+    if end is not None:
+        stmt = stmt.where(model.when <= end)
+    return stmt
+
+
+async def get_bookings_between(
+    session: AsyncSession,
+    start: date | None = None,
+    end: date | None = None,
+    *,
+    guest_id: int | None = None,
+    time_slot_id: int | None = None,
+    today: date | None = None,
+) -> list[BookingOut]:
+    """[start, end] 구간의 예약을 (when, id) 순으로 돌려준다.
+
+    구간이 보관 기준일 이후에서 시작하면 bookings 만 읽는다. 그 밖에는
+    bookings_archive 와 합치는데, 기준일 이전이지만 아직 옮기지 않은 예약이
+    bookings 에 남아 있을 수 있어서 bookings 도 함께 읽는다.
+    """
+    cutoff = archive_cutoff(today)
+    hot = _range_query(Booking, start, end, guest_id, time_slot_id)
+    if start is not None and start >= cutoff:
+        stmt = hot
+    else:
+        cold = _range_query(BookingArchive, start, end, guest_id, time_slot_id)
+        stmt = union_all(hot, cold)
+    stmt = stmt.order_by("when", "id")
+    rows = (await session.execute(stmt)).all()
+    return [BookingOut.from_row(row) for row in rows]
@@ -0,0 +1,174 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot, masks_including
+
+
+@dataclass(frozen=True, slots=True)
+class Window:
+    start: datetime
+    end: datetime
+    time_slot_id: int
+
+
+def occurrence_bounds(when: date, start_time: time, end_time: time) -> tuple[datetime, datetime]:
+    start = datetime.combine(when, start_time)
+    end = datetime.combine(when, end_time)
+    # 종료 시각이 시작 시각보다 이르면 자정을 넘기는 슬롯으로 본다.
+    if end <= start:
+        end += timedelta(days=1)
+    return start, end
+
+
+def expand_time_slots(
+    time_slots: Iterable[TimeSlot],
+    start_date: date,
+    end_date: date,
+) -> Iterator[Window]:
+    """요일 반복 슬롯을 [start_date, end_date] 구간의 실제 일정으로 펼친다."""
+    slots_by_weekday: dict[int, list[TimeSlot]] = defaultdict(list)
+    for slot in time_slots:
+        for weekday in slot.weekdays:
+            slots_by_weekday[weekday].append(slot)
+    for slots in slots_by_weekday.values():
+        slots.sort(key=lambda slot: slot.start_time)
+
+    current = start_date
+    while current <= end_date:
+        for slot in slots_by_weekday.get(current.weekday(), ()):
+            start, end = occurrence_bounds(current, slot.start_time, slot.end_time)
+            yield Window(start=start, end=end, time_slot_id=slot.id)
+        current += timedelta(days=1)
+
+
+class IntervalIndex:
+    """시작 시각으로 정렬된 구간 목록.
+
+    구간끼리 겹칠 수 있으므로 종료 시각의 누적 최댓값을 함께 두고,
+    겹치는 구간 조회를 O(log n + k)로 처리한다.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime]] = ()):
+        ordered = sorted(intervals)
+        self._starts = [start for start, _ in ordered]
+        self._ends = [end for _, end in ordered]
+        self._max_ends = list(accumulate(self._ends, max))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        # 누적 최댓값이 start 이하인 앞쪽 구간은 절대 겹치지 않는다.
+        lo = bisect_right(self._max_ends, start)
+        hi = bisect_left(self._starts, end)
+        return [
+            (self._starts[i], self._ends[i])
+            for i in range(lo, hi)
+            if self._ends[i] > start
+        ]
+
+    def subtract(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """[start, end) 에서 색인된 구간을 모두 뺀 나머지 구간들을 돌려준다."""
+        free = []
+        cursor = start
+        for busy_start, busy_end in self.overlapping(start, end):
+            if busy_start > cursor:
+                free.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            if cursor >= end:
+                break
+        if cursor < end:
+            free.append((cursor, end))
+        return free
+
+
+def weekdays_in_range(start_date: date, end_date: date) -> list[int]:
+    days = (end_date - start_date).days + 1
+    if days >= 7:
+        return list(range(7))
+    return sorted({(start_date + timedelta(days=offset)).weekday() for offset in range(max(days, 0))})
+
+
+def time_slots_on_weekdays(calendar_id: int, weekdays: list[int]):
+    """calendar_id, weekday_mask, start_time 복합 인덱스를 타는 슬롯 조회 쿼리."""
+    return (
+        select(TimeSlot)
+        .where(
+            TimeSlot.calendar_id == calendar_id,
+            TimeSlot.weekday_mask.in_(masks_including(weekdays)),
+        )
+        .order_by(TimeSlot.start_time)
+    )
+
+
+def build_booking_index(
+    time_slots: Sequence[TimeSlot],
+    bookings: Iterable[Booking],
+) -> IntervalIndex:
+    slots_by_id = {slot.id: slot for slot in time_slots}
+    intervals = []
+    for booking in bookings:
+        slot = slots_by_id.get(booking.time_slot_id)
+        if slot is None:
+            continue
+        intervals.append(occurrence_bounds(booking.when, slot.start_time, slot.end_time))
+    return IntervalIndex(intervals)
+
+
+def compute_free_windows(
+    time_slots: Sequence[TimeSlot],
+    bookings: Iterable[Booking],
+    start_date: date,
+    end_date: date,
+) -> list[Window]:
+    index = build_booking_index(time_slots, bookings)
+    windows = []
+    for occurrence in expand_time_slots(time_slots, start_date, end_date):
+        for start, end in index.subtract(occurrence.start, occurrence.end):
+            windows.append(Window(start=start, end=end, time_slot_id=occurrence.time_slot_id))
+    return windows
+
+
+async def get_free_windows(
+    session: AsyncSession,
+    host_id: int,
+    start_date: date,
+    end_date: date,
+) -> list[Window]:
+    """호스트의 예약 가능한 시간대를 조회한다.
+
+    슬롯과 예약을 각각 한 번의 쿼리로 읽어 온 뒤 메모리에서 계산한다.
+    """
+    calendar_id = await session.scalar(
+        select(Calendar.id).where(Calendar.host_id == host_id)
+    )
+    if calendar_id is None:
+        return []
+
+    # 자정을 넘기는 슬롯의 전날 예약도 계산해야 하므로 하루 앞 요일까지 포함한다.
+    weekdays = weekdays_in_range(start_date - timedelta(days=1), end_date)
+    if not weekdays:
+        return []
+    time_slots = (await session.scalars(
+        time_slots_on_weekdays(calendar_id, weekdays)
+    )).all()
+    if not time_slots:
+        return []
+
+    bookings = (await session.scalars(
+        select(Booking)
+        .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+        .where(
+            TimeSlot.calendar_id == calendar_id,
+            Booking.when >= start_date - timedelta(days=1),
+            Booking.when <= end_date,
+        )
+    )).all()
+    return compute_free_windows(time_slots, bookings, start_date, end_date)
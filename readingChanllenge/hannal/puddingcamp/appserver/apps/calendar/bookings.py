@@ -0,0 +1,147 @@
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+from sqlalchemy import insert, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.cache import mark_calendar_changed
+from appserver.apps.calendar.google_sync import google_calendar_sync
+from appserver.apps.calendar.exceptions import (
+    AlreadyBookedError,
+    TimeSlotNotFoundError,
+    UnavailableWeekdayError,
+)
+from appserver.apps.calendar.models import Booking, TimeSlot
+from appserver.apps.calendar.schemas import BookingCreateIn, BookingOut, BulkBookingOut, RejectedBooking
+from appserver.db import dialect_insert
+
+BULK_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int = BULK_CHUNK_SIZE) -> Iterator[list[T]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _load_time_slots(session: AsyncSession, ids: set[int]) -> dict[int, TimeSlot]:
+    time_slots = {}
+    for chunk in chunked(sorted(ids)):
+        result = await session.scalars(select(TimeSlot).where(TimeSlot.id.in_(chunk)))
+        time_slots.update((slot.id, slot) for slot in result)
+    return time_slots
+
+
+async def _load_booked_keys(session: AsyncSession, keys: set[tuple[int, object]]) -> set[tuple[int, object]]:
+    booked = set()
+    for chunk in chunked(sorted(keys)):
+        result = await session.execute(
+            select(Booking.time_slot_id, Booking.when)
+            .where(tuple_(Booking.time_slot_id, Booking.when).in_(chunk))
+        )
+        booked.update((row.time_slot_id, row.when) for row in result)
+    return booked
+
+
+async def bulk_create_bookings(
+    session: AsyncSession,
+    items: Sequence[BookingCreateIn],
+) -> BulkBookingOut:
+    """예약을 한꺼번에 검증하고 청크 단위로 저장한다.
+
+    슬롯 조회와 중복 확인은 각각 청크당 한 번의 쿼리로 끝내고,
+    저장은 청크마다 executemany 한 번으로 처리한다.
+    동시에 들어온 요청 사이의 중복은 uq_time_slot_id_when 제약이 막는다.
+    """
+    time_slots = await _load_time_slots(session, {item.time_slot_id for item in items})
+    booked = await _load_booked_keys(
+        session,
+        {(item.time_slot_id, item.when) for item in items if item.time_slot_id in time_slots},
+    )
+
+    rejected = []
+    rows = []
+    for index, item in enumerate(items):
+        key = (item.time_slot_id, item.when)
+        time_slot = time_slots.get(item.time_slot_id)
+        if time_slot is None:
+            rejected.append(RejectedBooking(index=index, reason="존재하지 않는 시간대입니다."))
+        elif item.when.weekday() not in time_slot.weekdays:
+            rejected.append(RejectedBooking(index=index, reason="예약할 수 없는 요일입니다."))
+        elif key in booked:
+            rejected.append(RejectedBooking(index=index, reason="이미 예약된 시간대입니다."))
+        else:
+            booked.add(key)
+            rows.append(item.model_dump())
+
+    for chunk in chunked(rows):
+        await session.execute(insert(Booking), chunk)
+    # 대량 insert는 매퍼 이벤트를 거치지 않으므로 캐시 무효화 대상을 직접 기록한다.
+    mark_calendar_changed(
+        session.sync_session,
+        *{time_slots[row["time_slot_id"]].calendar_id for row in rows},
+    )
+    await session.commit()
+
+    return BulkBookingOut(created=len(rows), rejected=rejected)
+
+
+async def reserve_booking(session: AsyncSession, item: BookingCreateIn) -> BookingOut:
+    """예약 한 건을 INSERT ... SELECT ... ON CONFLICT DO NOTHING 한 번으로 잡는다.
+
+    시간대 존재 여부와 요일 검사는 SELECT 조건으로, 중복 예약은
+    uq_time_slot_id_when 충돌로 걸러내므로 확인 후 저장하는 사이의 경쟁이 없다.
+    같은 자리를 여러 명이 동시에 요청해도 한 명만 행을 돌려받고
+    나머지는 재시도 없이 바로 실패한다.
+    """
+    candidate = (
+        select(
+            TimeSlot.id,
+            literal(item.guest_id),
+            literal(item.when),
+            literal(item.topic),
+            literal(item.description),
+        )
+        .where(
+            TimeSlot.id == item.time_slot_id,
+            TimeSlot.weekday_mask.op("&")(1 << item.when.weekday()) != 0,
+        )
+    )
+    # 캘린더 id 도 RETURNING 의 서브쿼리로 함께 받아 성공 경로의 왕복을 한 번으로 끝낸다.
+    # 행이 들어간 경우에만 RETURNING 이 평가되므로 time_slots PK 조회가 한 번 더 붙을 뿐이다.
+    calendar_id = (
+        select(TimeSlot.calendar_id)
+        .where(TimeSlot.id == item.time_slot_id)
+        .scalar_subquery()
+    )
+    stmt = (
+        dialect_insert(session, Booking)
+        .from_select(["time_slot_id", "guest_id", "when", "topic", "description"], candidate)
+        .on_conflict_do_nothing(index_elements=["time_slot_id", "when"])
+        .returning(Booking.id, calendar_id)
+    )
+    row = (await session.execute(stmt)).one_or_none()
+
+    if row is None:
+        await session.rollback()
+        # 실패한 경우에만 이유를 알아내기 위해 한 번 더 조회한다.
+        time_slot = await session.get(TimeSlot, item.time_slot_id)
+        if time_slot is None:
+            raise TimeSlotNotFoundError()
+        if item.when.weekday() not in time_slot.weekdays:
+            raise UnavailableWeekdayError()
+        raise AlreadyBookedError()
+
+    booking_id, calendar_id = row
+    mark_calendar_changed(session.sync_session, calendar_id)
+    await session.commit()
+    # Core INSERT 는 매퍼 이벤트를 거치지 않으므로 동기화 작업을 직접 넣는다.
+    google_calendar_sync.enqueue(calendar_id, booking_id)
+    return BookingOut(id=booking_id, **item.model_dump())
@@ -0,0 +1,98 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.repositories import get_calendar, time_slot_calendar_ids
+from appserver.apps.calendar.schemas import CalendarDetailOut
+from appserver.cache import create_cache
+from appserver.settings import settings
+
+calendar_cache = create_cache(
+    settings.cache_backend,
+    url=settings.cache_url,
+    maxsize=settings.cache_maxsize,
+    ttl=settings.cache_ttl,
+)
+
+_PENDING_KEY = "changed_calendar_ids"
+_PENDING_TIME_SLOT_KEY = "changed_booking_time_slot_ids"
+
+# 커밋 후 바뀐 캘린더 id 들을 받을 함수들. 캐시 말고도 변경을 알아야 하는 곳이 등록한다.
+calendar_change_hooks: list[Callable[[set[int]], None]] = []
+
+
+def calendar_key(calendar_id: int) -> str:
+    return f"calendar:{calendar_id}"
+
+
+async def get_calendar_detail(session: AsyncSession, calendar_id: int) -> CalendarDetailOut | None:
+    """캘린더 화면 데이터를 캐시에서 먼저 찾고, 없으면 DB에서 읽어 채운다."""
+    key = calendar_key(calendar_id)
+    cached = await calendar_cache.get(key)
+    if cached is not None:
+        return CalendarDetailOut.model_validate(cached)
+
+    calendar = await get_calendar(session, calendar_id, profile="calendar_slots")
+    if calendar is None:
+        return None
+    detail = CalendarDetailOut.from_row(calendar)
+    await calendar_cache.set(key, detail.model_dump(mode="json"))
+    return detail
+
+
+def mark_calendar_changed(session: Session | None, *calendar_ids: int | None) -> None:
+    """커밋이 끝나면 캐시에서 지울 캘린더를 세션에 기록한다."""
+    if session is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    pending.update(calendar_id for calendar_id in calendar_ids if calendar_id is not None)
+
+
+@event.listens_for(Calendar, "after_insert")
+@event.listens_for(Calendar, "after_update")
+@event.listens_for(Calendar, "after_delete")
+def calendar_changed(mapper, connection, target: Calendar) -> None:
+    mark_calendar_changed(object_session(target), target.id)
+
+
+@event.listens_for(TimeSlot, "after_insert")
+@event.listens_for(TimeSlot, "after_update")
+@event.listens_for(TimeSlot, "after_delete")
+def time_slot_changed(mapper, connection, target: TimeSlot) -> None:
+    mark_calendar_changed(object_session(target), target.calendar_id)
+
+
+@event.listens_for(Booking, "after_insert")
+@event.listens_for(Booking, "after_update")
+@event.listens_for(Booking, "after_delete")
+def booking_changed(mapper, connection, target: Booking) -> None:
+    # 예약마다 캘린더를 조회하지 않고 시간대 id 만 모아 두었다가 flush 가 끝나면 한 번에 찾는다.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_TIME_SLOT_KEY, set()).add(target.time_slot_id)
+
+
+@event.listens_for(Session, "after_flush")
+def resolve_booking_calendars(session: Session, flush_context) -> None:
+    time_slot_ids = session.info.pop(_PENDING_TIME_SLOT_KEY, None)
+    if time_slot_ids:
+        mark_calendar_changed(session, *time_slot_calendar_ids(session, time_slot_ids).values())
+
+
+# 커밋 전에 지우면 그 사이 다른 요청이 옛 데이터를 다시 채울 수 있으므로 커밋 후에 지운다.
+@event.listens_for(Session, "after_commit")
+def invalidate_after_commit(session: Session) -> None:
+    calendar_ids = session.info.pop(_PENDING_KEY, None)
+    if calendar_ids:
+        calendar_cache.invalidate(*(calendar_key(calendar_id) for calendar_id in calendar_ids))
+        for hook in calendar_change_hooks:
+            hook(calendar_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_TIME_SLOT_KEY, None)
@@ -0,0 +1,157 @@
+from datetime import timedelta
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import AwareDatetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.calendar.bookings import bulk_create_bookings, reserve_booking
+from appserver.apps.calendar.cache import get_calendar_detail
+from appserver.apps.calendar.listing import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    list_bookings,
+    stream_bookings_ndjson,
+)
+from appserver.apps.calendar.live import availability_broker
+from appserver.apps.calendar.models import Calendar
+from appserver.apps.calendar.occurrences import get_open_occurrences
+from appserver.apps.calendar.schemas import (
+    BookingCreateIn,
+    BookingOut,
+    BookingPageOut,
+    BulkBookingIn,
+    BulkBookingOut,
+    CalendarDetailOut,
+    SlotOccurrenceOut,
+)
+from appserver.db import database, use_read_session, use_session
+from appserver.responses import PydanticJSONResponse
+from appserver.settings import settings
+
+router = APIRouter()
+
+SessionDep = Annotated[AsyncSession, Depends(use_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(use_read_session)]
+PageSizeQuery = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+@router.get("/calendars/{calendar_id}", response_model=CalendarDetailOut)
+async def calendar_detail(calendar_id: int, session: ReadSessionDep) -> PydanticJSONResponse:
+    calendar = await get_calendar_detail(session, calendar_id)
+    if calendar is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="캘린더가 없습니다.")
+    return PydanticJSONResponse(calendar)
+
+
+@router.get("/calendars/{calendar_id}/availability", response_model=list[SlotOccurrenceOut])
+async def calendar_availability(
+    calendar_id: int,
+    start: AwareDatetime,
+    end: AwareDatetime,
+    session: ReadSessionDep,
+) -> PydanticJSONResponse:
+    if not timedelta(0) < end - start <= timedelta(days=93):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="조회 기간은 0보다 길고 93일 이하여야 합니다.",
+        )
+    occurrences = await get_open_occurrences(session, calendar_id, start, end)
+    return PydanticJSONResponse([
+        SlotOccurrenceOut.from_row(occurrence)
+        for occurrence in occurrences
+    ])
+
+
+@router.get("/calendars/{calendar_id}/availability/stream")
+async def calendar_availability_stream(calendar_id: int) -> StreamingResponse:
+    """예약 가능 시간이 바뀔 때마다 Server-Sent Events 로 보내 준다."""
+    if availability_broker.full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="연결이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+        )
+    # 연결 내내 세션을 붙잡지 않도록 의존성 대신 짧게 열어 확인만 한다.
+    async with database.read_session_factory() as session:
+        if await session.get(Calendar, calendar_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="캘린더가 없습니다.")
+    return StreamingResponse(
+        availability_broker.stream(calendar_id, settings.availability_stream_heartbeat),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/bookings", status_code=status.HTTP_201_CREATED)
+async def create_booking(payload: BookingCreateIn, session: SessionDep) -> BookingOut:
+    try:
+        return await reserve_booking(session, payload)
+    except IntegrityError:
+        # 같은 날짜 중복은 ON CONFLICT 로 걸러지므로 남는 것은 외래 키 위반이다.
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 게스트이거나 시간대입니다.",
+        )
+
+
+@router.post("/bookings/bulk", status_code=status.HTTP_201_CREATED)
+async def create_bookings_bulk(payload: BulkBookingIn, session: SessionDep) -> BulkBookingOut:
+    try:
+        return await bulk_create_bookings(session, payload.bookings)
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="다른 요청과 예약이 겹쳤습니다. 다시 시도해 주세요.",
+        )
+
+
+@router.get("/guests/{guest_id}/bookings", response_model=BookingPageOut)
+async def guest_bookings(
+    guest_id: int,
+    session: ReadSessionDep,
+    cursor: str | None = None,
+    limit: PageSizeQuery = DEFAULT_PAGE_SIZE,
+) -> PydanticJSONResponse:
+    try:
+        page = await list_bookings(session, guest_id=guest_id, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return PydanticJSONResponse(page)
+
+
+@router.get("/time-slots/{time_slot_id}/bookings", response_model=BookingPageOut)
+async def time_slot_bookings(
+    time_slot_id: int,
+    session: ReadSessionDep,
+    cursor: str | None = None,
+    limit: PageSizeQuery = DEFAULT_PAGE_SIZE,
+) -> PydanticJSONResponse:
+    try:
+        page = await list_bookings(session, time_slot_id=time_slot_id, cursor=cursor, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return PydanticJSONResponse(page)
+
+
+def _export_response(**filters) -> StreamingResponse:
+    # 의존성으로 받은 세션은 응답을 보내기 전에 닫히므로 스트림이 직접 세션을 연다.
+    async def content():
+        async with database.read_session_factory() as session:
+            async for chunk in stream_bookings_ndjson(session, **filters):
+                yield chunk
+
+    return StreamingResponse(content(), media_type="application/x-ndjson")
+
+
+@router.get("/guests/{guest_id}/bookings/export")
+async def export_guest_bookings(guest_id: int) -> StreamingResponse:
+    return _export_response(guest_id=guest_id)
+
+
+@router.get("/time-slots/{time_slot_id}/bookings/export")
+async def export_time_slot_bookings(time_slot_id: int) -> StreamingResponse:
+    return _export_response(time_slot_id=time_slot_id)
@@ -0,0 +1,35 @@
+from fastapi import HTTPException, status
+
+
+class TimeSlotNotFoundError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 시간대입니다.",
+        )
+
+
+class UnavailableWeekdayError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="예약할 수 없는 요일입니다.",
+        )
+
+
+class AlreadyBookedError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 예약된 시간대입니다.",
+        )
+
+
+class InvalidFieldError(HTTPException):
+    """쓰기 직전 검증(models.py 의 before_insert/before_update)에서 걸린 값."""
+
+    def __init__(self, field: str, errors: list[dict]):
+        super().__init__(
+            status_code=422,  # 요청 검증 오류(RequestValidationError)와 같은 코드
+            detail=[{**error, "loc": (field, *error["loc"])} for error in errors],
+        )
@@ -0,0 +1,207 @@
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo
+
+import httpx
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from appserver.apps.calendar.availability import occurrence_bounds
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.repositories import time_slot_calendar_ids
+from appserver.db import database
+from appserver.jobs import CoalescingJobRunner
+from appserver.settings import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "google_sync_bookings"
+_FLUSHED_KEY = "google_sync_flushed_bookings"
+
+
+@dataclass(frozen=True, slots=True)
+class BookingSyncOp:
+    booking_id: int
+    deleted: bool = False
+
+
+def event_id(booking_id: int) -> str:
+    # Google 일정 ID는 base32hex 문자(a-v, 0-9)만 쓸 수 있다.
+    return f"booking{booking_id}"
+
+
+class GoogleCalendarClient:
+    """Google Calendar API 중 예약 동기화에 필요한 부분만 감싼다.
+
+    base_url 이나 transport 를 바꾸면 로컬 가짜 서버를 상대로 시험할 수 있다.
+    """
+
+    def __init__(self, base_url: str, token: str | None = None, transport: httpx.AsyncBaseTransport | None = None):
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._client = httpx.AsyncClient(base_url=base_url, headers=headers, transport=transport, timeout=10)
+
+    async def upsert_event(self, calendar_id: str, event_id: str, body: dict) -> None:
+        response = await self._client.put(f"/calendars/{calendar_id}/events/{event_id}", json=body)
+        if response.status_code == 404:
+            response = await self._client.post(f"/calendars/{calendar_id}/events", json={"id": event_id, **body})
+        response.raise_for_status()
+
+    async def delete_event(self, calendar_id: str, event_id: str) -> None:
+        response = await self._client.delete(f"/calendars/{calendar_id}/events/{event_id}")
+        if response.status_code in (404, 410):
+            return
+        response.raise_for_status()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def event_body(booking: Booking, time_slot: TimeSlot, calendar_timezone: str) -> dict:
+    start, end = occurrence_bounds(booking.when, time_slot.start_time, time_slot.end_time)
+    tz = ZoneInfo(calendar_timezone)
+    return {
+        "summary": booking.topic,
+        "description": booking.description,
+        "start": {"dateTime": start.replace(tzinfo=tz).isoformat(), "timeZone": calendar_timezone},
+        "end": {"dateTime": end.replace(tzinfo=tz).isoformat(), "timeZone": calendar_timezone},
+    }
+
+
+class GoogleCalendarSync:
+    """예약 변경을 캘린더별로 모아 Google Calendar 에 반영한다.
+
+    예약 요청은 큐에 넣고 바로 돌아가며, 같은 예약이 여러 번 바뀌면 마지막 상태만 보낸다.
+    """
+
+    def __init__(
+        self,
+        config: Settings = settings,
+        transport: httpx.AsyncBaseTransport | None = None,
+        concurrency: int = 8,
+    ):
+        self.config = config
+        self.transport = transport
+        self.concurrency = concurrency
+        self.client: GoogleCalendarClient | None = None
+        self.runner = CoalescingJobRunner(
+            self.sync_batch,
+            workers=config.google_sync_workers,
+            batch_size=config.google_sync_batch_size,
+            max_attempts=config.google_sync_max_attempts,
+            name="google-sync",
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.google_sync_enabled
+
+    def enqueue(self, calendar_id: int, booking_id: int, deleted: bool = False) -> None:
+        if self.enabled:
+            self.runner.submit(calendar_id, booking_id, BookingSyncOp(booking_id, deleted))
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        self.client = GoogleCalendarClient(
+            self.config.google_calendar_api_url,
+            self.config.google_api_token,
+            transport=self.transport,
+        )
+        await self.runner.start()
+
+    async def stop(self, timeout: float = 10) -> None:
+        # 종료할 때는 남은 작업을 잠깐 기다려 주되, API 장애로 재시도 중이면 오래 붙잡지 않는다.
+        if self.runner.started:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self.runner.join(), timeout)
+        await self.runner.stop(drain=False)
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def sync_batch(self, calendar_id: int, ops: list[BookingSyncOp]) -> None:
+        async with database.session_factory() as session:
+            calendar = await session.get(Calendar, calendar_id)
+            if calendar is None or not calendar.google_calendar_id:
+                return
+            booking_ids = [op.booking_id for op in ops if not op.deleted]
+            rows = (await session.execute(
+                select(Booking, TimeSlot)
+                .join(TimeSlot, Booking.time_slot_id == TimeSlot.id)
+                .where(Booking.id.in_(booking_ids))
+            )).all() if booking_ids else []
+        bookings = {booking.id: (booking, time_slot) for booking, time_slot in rows}
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def apply(op: BookingSyncOp) -> None:
+            async with semaphore:
+                found = bookings.get(op.booking_id)
+                if op.deleted or found is None:
+                    await self.client.delete_event(calendar.google_calendar_id, event_id(op.booking_id))
+                else:
+                    booking, time_slot = found
+                    await self.client.upsert_event(
+                        calendar.google_calendar_id,
+                        event_id(op.booking_id),
+                        event_body(booking, time_slot, calendar.timezone),
+                    )
+
+        # 요청은 모두 멱등이므로 하나라도 실패하면 묶음 전체를 다시 시도해도 된다.
+        results = await asyncio.gather(*(apply(op) for op in ops), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+
+google_calendar_sync = GoogleCalendarSync()
+
+
+def _record_booking_change(target: Booking, deleted: bool) -> None:
+    if not google_calendar_sync.enabled:
+        return
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(_FLUSHED_KEY, []).append((target.time_slot_id, target.id, deleted))
+
+
+@event.listens_for(Booking, "after_insert")
+@event.listens_for(Booking, "after_update")
+def booking_changed(mapper, connection, target: Booking) -> None:
+    _record_booking_change(target, deleted=False)
+
+
+# after_delete 시점에는 아직 flush 가 끝나지 않아 inspect(target).deleted 가 False 이므로
+# 삭제는 리스너를 따로 둔다.
+@event.listens_for(Booking, "after_delete")
+def booking_deleted(mapper, connection, target: Booking) -> None:
+    _record_booking_change(target, deleted=True)
+
+
+@event.listens_for(Session, "after_flush")
+def resolve_booking_calendars(session: Session, flush_context) -> None:
+    # 예약마다 캘린더를 조회하지 않고 flush 가 끝난 뒤 시간대 id 들을 한 번에 찾는다.
+    flushed = session.info.pop(_FLUSHED_KEY, None)
+    if not flushed:
+        return
+    calendar_ids = time_slot_calendar_ids(session, {time_slot_id for time_slot_id, _, _ in flushed})
+    session.info.setdefault(_PENDING_KEY, []).extend(
+        (calendar_ids[time_slot_id], booking_id, deleted)
+        for time_slot_id, booking_id, deleted in flushed
+        if time_slot_id in calendar_ids
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def enqueue_after_commit(session: Session) -> None:
+    for calendar_id, booking_id, deleted in session.info.pop(_PENDING_KEY, ()):
+        google_calendar_sync.enqueue(calendar_id, booking_id, deleted)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_FLUSHED_KEY, None)
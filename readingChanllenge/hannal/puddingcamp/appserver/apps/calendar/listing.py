@@ -0,0 +1,112 @@
+import base64
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import Select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.archive import archive_cutoff, booking_rows
+from appserver.apps.calendar.models import Booking, BookingArchive
+from appserver.apps.calendar.schemas import BookingOut, BookingPageOut
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 1000
+
+
+def encode_cursor(when: date, booking_id: int) -> str:
+    raw = f"{when.isoformat()}|{booking_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        when, booking_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return date.fromisoformat(when), int(booking_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("잘못된 커서입니다.") from exc
+
+
+def _keyset_query(
+    model,
+    guest_id: int | None,
+    time_slot_id: int | None,
+    after: tuple[date, int] | None,
+    limit: int | None,
+) -> Select:
+    stmt = booking_rows(model)
+    if guest_id is not None:
+        stmt = stmt.where(model.guest_id == guest_id)
+    if time_slot_id is not None:
+        stmt = stmt.where(model.time_slot_id == time_slot_id)
+    if after is not None:
+        stmt = stmt.where(tuple_(model.when, model.id) > after)
+    return stmt.order_by(model.when, model.id).limit(limit)
+
+
+def bookings_query(
+    *,
+    guest_id: int | None = None,
+    time_slot_id: int | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    today: date | None = None,
+) -> Select:
+    """(when, id) 순으로 정렬한 예약 조회 쿼리.
+
+    OFFSET 대신 마지막으로 본 (when, id) 다음부터 읽으므로
+    ix_bookings_*_when_id 인덱스에서 바로 이어서 읽을 수 있다.
+    커서가 보관 기준일 이전이면(첫 페이지 포함) bookings_archive 도 같은 순서로
+    읽어 UNION ALL 로 합친다. 두 쪽 모두 limit 건만 읽으면 충분하다.
+    """
+    after = decode_cursor(cursor) if cursor is not None else None
+    hot = _keyset_query(Booking, guest_id, time_slot_id, after, limit)
+    if after is not None and after[0] >= archive_cutoff(today):
+        return hot
+    cold = _keyset_query(BookingArchive, guest_id, time_slot_id, after, limit)
+    rows = union_all(select(hot.subquery()), select(cold.subquery())).subquery()
+    return select(rows).order_by(rows.c.when, rows.c.id).limit(limit)
+
+
+async def list_bookings(
+    session: AsyncSession,
+    *,
+    guest_id: int | None = None,
+    time_slot_id: int | None = None,
+    cursor: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> BookingPageOut:
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    # 한 건을 더 읽어서 다음 페이지가 있는지 확인한다.
+    stmt = bookings_query(guest_id=guest_id, time_slot_id=time_slot_id, cursor=cursor, limit=limit + 1)
+    bookings = (await session.execute(stmt)).all()
+
+    next_cursor = None
+    if len(bookings) > limit:
+        bookings = bookings[:limit]
+        last = bookings[-1]
+        next_cursor = encode_cursor(last.when, last.id)
+    return BookingPageOut(
+        items=[BookingOut.from_row(booking) for booking in bookings],
+        next_cursor=next_cursor,
+    )
+
+
+async def stream_bookings_ndjson(
+    session: AsyncSession,
+    *,
+    guest_id: int | None = None,
+    time_slot_id: int | None = None,
+) -> AsyncIterator[bytes]:
+    """예약을 서버 측 커서로 조금씩 읽어 NDJSON 한 줄씩 내보낸다."""
+    stmt = (
+        bookings_query(guest_id=guest_id, time_slot_id=time_slot_id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    result = await session.stream(stmt)
+    async for partition in result.partitions():
+        yield b"".join(
+            BookingOut.from_row(booking).model_dump_json().encode() + b"\n"
+            for booking in partition
+        )
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+from pydantic import TypeAdapter
+
+from appserver.apps.calendar.cache import calendar_change_hooks
+from appserver.apps.calendar.occurrences import get_open_occurrences, occurrence_change_hooks
+from appserver.apps.calendar.schemas import SlotOccurrenceOut
+from appserver.db import database
+from appserver.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_occurrences_adapter = TypeAdapter(list[SlotOccurrenceOut])
+
+# 조회 기간이 현재 시각 기준이므로 변경이 없어도 이보다 오래된 snapshot 은 다시 읽는다.
+STALE_AFTER = 60
+
+
+class TooManySubscribersError(Exception):
+    pass
+
+
+class Channel:
+    """캘린더 하나의 최신 예약 가능 시간과 구독자 수.
+
+    구독자마다 큐를 두지 않고 모두 같은 snapshot 을 본다. 느린 구독자는 중간 변경을
+    건너뛰고 최신 값만 받으므로 연결 수가 늘어도 메모리는 구독자당 상수로 묶인다.
+    """
+
+    __slots__ = ("calendar_id", "subscribers", "snapshot", "version", "refreshed_at", "_changed", "_refreshing", "_dirty")
+
+    def __init__(self, calendar_id: int):
+        self.calendar_id = calendar_id
+        self.subscribers = 0
+        self.snapshot: bytes | None = None
+        self.version = 0
+        self.refreshed_at = 0.0
+        self._changed = asyncio.Event()
+        self._refreshing: asyncio.Task | None = None
+        self._dirty = False
+
+    def publish(self, snapshot: bytes) -> None:
+        self.snapshot = snapshot
+        self.version += 1
+        self.refreshed_at = asyncio.get_running_loop().time()
+        # 기다리던 구독자를 모두 깨우고, 다음 변경은 새 Event 로 기다리게 한다.
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_changed(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class AvailabilityBroker:
+    """예약 변경을 받아 캘린더별로 한 번만 조회하고 모든 구독자에게 나눠 준다."""
+
+    def __init__(self, max_subscribers: int = 10000, days: int = 14):
+        self.max_subscribers = max_subscribers
+        self.days = days
+        self.subscribers = 0
+        self._channels: dict[int, Channel] = {}
+
+    @property
+    def full(self) -> bool:
+        return self.subscribers >= self.max_subscribers
+
+    def subscribe(self, calendar_id: int) -> Channel:
+        if self.full:
+            raise TooManySubscribersError()
+        channel = self._channels.get(calendar_id)
+        if channel is None:
+            channel = self._channels[calendar_id] = Channel(calendar_id)
+            self.refresh(channel)
+        channel.subscribers += 1
+        self.subscribers += 1
+        return channel
+
+    def unsubscribe(self, channel: Channel) -> None:
+        channel.subscribers -= 1
+        self.subscribers -= 1
+        if channel.subscribers == 0:
+            self._channels.pop(channel.calendar_id, None)
+            if channel._refreshing is not None:
+                channel._refreshing.cancel()
+
+    def notify(self, calendar_ids: set[int]) -> None:
+        for calendar_id in calendar_ids:
+            channel = self._channels.get(calendar_id)
+            # 보고 있는 사람이 없는 캘린더는 조회하지 않는다.
+            if channel is not None:
+                self.refresh(channel)
+
+    def refresh(self, channel: Channel) -> None:
+        if channel._refreshing is not None:
+            # 조회 중에 또 바뀌었으면 끝난 뒤 한 번 더 조회한다.
+            channel._dirty = True
+            return
+        channel._refreshing = asyncio.get_running_loop().create_task(self._refresh(channel))
+
+    async def _refresh(self, channel: Channel) -> None:
+        try:
+            while True:
+                channel._dirty = False
+                try:
+                    channel.publish(await self.load_snapshot(channel.calendar_id))
+                except Exception:
+                    logger.exception("캘린더 %s 의 예약 가능 시간을 읽지 못했습니다.", channel.calendar_id)
+                    break
+                if not channel._dirty:
+                    break
+        finally:
+            channel._refreshing = None
+
+    async def load_snapshot(self, calendar_id: int) -> bytes:
+        start = datetime.now(timezone.utc)
+        # 복제 지연으로 방금 커밋된 예약이 빠지지 않도록 주 DB 에서 읽는다.
+        async with database.session_factory() as session:
+            occurrences = await get_open_occurrences(session, calendar_id, start, start + timedelta(days=self.days))
+        data = _occurrences_adapter.dump_json([
+            SlotOccurrenceOut.from_row(occurrence)
+            for occurrence in occurrences
+        ])
+        return b"event: availability\ndata: " + data + b"\n\n"
+
+    async def stream(self, calendar_id: int, heartbeat: float) -> AsyncIterator[bytes]:
+        """구독자 한 명에게 보낼 SSE 메시지들. 끊기면 구독을 해제한다.
+
+        응답이 시작되지 않으면 제너레이터도 실행되지 않으므로 구독은 여기서 시작한다.
+        """
+        channel = self.subscribe(calendar_id)
+        try:
+            seen = 0
+            while True:
+                if channel.version != seen and channel.snapshot is not None:
+                    seen = channel.version
+                    yield channel.snapshot
+                    continue
+                if not await channel.wait_changed(heartbeat):
+                    # 프록시가 유휴 연결을 끊지 않게 주석 한 줄을 보낸다.
+                    yield b": ping\n\n"
+                    # 시간이 흘러 조회 기간이 밀렸으므로 오래된 snapshot 은 새로 읽는다.
+                    if asyncio.get_running_loop().time() - channel.refreshed_at > STALE_AFTER:
+                        self.refresh(channel)
+        finally:
+            self.unsubscribe(channel)
+
+
+availability_broker = AvailabilityBroker(
+    max_subscribers=settings.availability_stream_max_subscribers,
+    days=settings.availability_stream_days,
+)
+# 예약 변경은 커밋 시점에 바로 반영되지만, 시간대나 캘린더 시간대를 바꾸면
+# slot_occurrences 가 백그라운드에서 다시 만들어진 뒤에야 새 일정이 보인다.
+calendar_change_hooks.append(availability_broker.notify)
+occurrence_change_hooks.append(availability_broker.notify)
@@ -1,10 +1,13 @@
 from datetime import date, time, timezone, datetime
 from typing import TYPE_CHECKING
-from pydantic import AwareDatetime
+from pydantic import AwareDatetime, TypeAdapter, ValidationError, conint
 from sqlalchemy_utc import UtcDateTime
 from sqlmodel import SQLModel, Field, Relationship, Text, JSON, func, String, column
+from sqlalchemy import Column, Index, Integer, UniqueConstraint, event, inspect
 from sqlalchemy.dialects.postgresql import JSONB
 
+from appserver.apps.calendar.exceptions import InvalidFieldError
+
 if TYPE_CHECKING: 
     from appserver.apps.account.models import User
 
@@ -16,6 +19,12 @@ class Calendar(SQLModel, table=True):
                               description="게스트와 나눌 주제들")
     description: str = Field(sa_type=Text, description="게스트에게 보여 줄 설명")
     google_calendar_id : str = Field(max_length=1024, description="Google Calendar ID")
+    timezone: str = Field(
+        default="UTC",
+        max_length=64,
+        sa_column_kwargs={"server_default": "UTC"},
+        description="시간대의 시각을 해석할 IANA 시간대 (예: Asia/Seoul)",
+    )
 
     host_id: int = Field(foreign_key="users.id", unique=True)
     host: "User" = Relationship(
@@ -45,6 +54,14 @@ class Calendar(SQLModel, table=True):
 
 class TimeSlot(SQLModel, table=True):
     __tablename__ = "time_slots"
+    __table_args__ = (
+        Index(
+            "ix_time_slots_calendar_id_weekday_mask_start_time",
+            "calendar_id",
+            "weekday_mask",
+            "start_time",
+        ),
+    )
 
     id: int = Field(default=None, primary_key=True)
     start_time: time
@@ -53,6 +70,11 @@ class TimeSlot(SQLModel, table=True):
         sa_type=JSON().with_variant(JSONB(astext_type=Text()), "postgresql"),
         description="예약 가능한 요일들"
     )
+    weekday_mask: int = Field(
+        default=0,
+        sa_column_kwargs={"server_default": "0"},
+        description="weekdays를 비트로 나타낸 값 (월요일=1 << 0)",
+    )
 
     calendar_id: int = Field(foreign_key="calendars.id")
     calendar: Calendar = Relationship(back_populates="time_slots")
@@ -77,8 +99,36 @@ class TimeSlot(SQLModel, table=True):
         },
     )
 
+class SlotOccurrence(SQLModel, table=True):
+    """반복 시간대를 실제 날짜로 펼쳐 UTC로 저장해 둔 일정."""
+    __tablename__ = "slot_occurrences"
+    __table_args__ = (
+        UniqueConstraint("time_slot_id", "local_date", name="uq_time_slot_id_local_date"),
+        Index("ix_slot_occurrences_calendar_id_starts_at", "calendar_id", "starts_at"),
+    )
+
+    id: int = Field(default=None, primary_key=True)
+    time_slot_id: int = Field(foreign_key="time_slots.id", ondelete="CASCADE")
+    calendar_id: int = Field(foreign_key="calendars.id", ondelete="CASCADE")
+    local_date: date = Field(description="캘린더 시간대 기준 날짜. Booking.when 과 같은 값")
+    starts_at: AwareDatetime = Field(sa_type=UtcDateTime)
+    ends_at: AwareDatetime = Field(sa_type=UtcDateTime)
+
+
+# 매퍼의 version_id_col 에 같은 Column 객체를 넘겨야 하므로 클래스 밖에서 만든다.
+booking_version_column = Column("version", Integer, nullable=False, server_default="1")
+
+
 class Booking(SQLModel, table=True):
     __tablename__ = "bookings"
+    __table_args__ = (
+        UniqueConstraint("time_slot_id", "when", name="uq_time_slot_id_when"),
+        Index("ix_bookings_guest_id_when_id", "guest_id", "when", "id"),
+        Index("ix_bookings_time_slot_id_when_id", "time_slot_id", "when", "id"),
+        # 보관 작업이 when 순으로 오래된 예약부터 읽는다.
+        Index("ix_bookings_when_id", "when", "id"),
+    )
+    __mapper_args__ = {"version_id_col": booking_version_column}
 
     id : int = Field(default=None, primary_key=True)
     when: date
@@ -91,6 +141,12 @@ class Booking(SQLModel, table=True):
     guest_id: int = Field(foreign_key="users.id")
     guest: "User" = Relationship(back_populates="bookings")
 
+    version: int = Field(
+        default=None,
+        sa_column=booking_version_column,
+        description="낙관적 잠금용 버전. 수정할 때마다 1씩 늘어난다.",
+    )
+
     created_at: AwareDatetime = Field(
         default=None,
         nullable=False,
@@ -108,4 +164,93 @@ class Booking(SQLModel, table=True):
             "onupdate": lambda: datetime.now(timezone.utc),
         }
     )
-    
+
+
+class BookingArchive(SQLModel, table=True):
+    """오래된 예약을 옮겨 두는 테이블. id 는 bookings 의 값을 그대로 쓴다."""
+    __tablename__ = "bookings_archive"
+    __table_args__ = (
+        Index("ix_bookings_archive_guest_id_when_id", "guest_id", "when", "id"),
+        Index("ix_bookings_archive_time_slot_id_when_id", "time_slot_id", "when", "id"),
+    )
+
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    when: date
+    topic: str
+    description: str = Field(sa_type=Text, description="예약 설명")
+    time_slot_id: int = Field(foreign_key="time_slots.id")
+    guest_id: int = Field(foreign_key="users.id")
+    version: int = Field(default=1)
+    created_at: AwareDatetime = Field(sa_type=UtcDateTime)
+    updated_at: AwareDatetime = Field(sa_type=UtcDateTime)
+    archived_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        },
+    )
+
+
+# 테이블 모델은 DB에서 읽을 때 검증하지 않으므로, 쓰기 직전에 한 번만 검증한다.
+# 스키마를 매번 만들지 않도록 모듈을 읽을 때 미리 만들어 둔다.
+weekdays_adapter = TypeAdapter(list[conint(ge=0, le=6, strict=True)])
+topics_adapter = TypeAdapter(list[str], config={"strict": True})
+
+# weekday_mask(7비트)로 요일 목록을 바로 찾는 표
+WEEKDAYS_BY_MASK: tuple[tuple[int, ...], ...] = tuple(
+    tuple(weekday for weekday in range(7) if mask >> weekday & 1)
+    for mask in range(1 << 7)
+)
+
+
+def mask_to_weekdays(mask: int) -> tuple[int, ...]:
+    return WEEKDAYS_BY_MASK[mask]
+
+
+def weekdays_to_mask(weekdays: list[int]) -> int:
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def masks_including(weekdays: list[int]) -> list[int]:
+    """주어진 요일 중 하나라도 포함하는 weekday_mask 값을 모두 돌려준다.
+
+    비트 연산 조건은 인덱스를 탈 수 없으므로 IN 목록으로 바꿔 범위 검색이 되게 한다.
+    """
+    required = weekdays_to_mask(weekdays)
+    return [mask for mask in range(1, 1 << 7) if mask & required]
+
+
+def _changed(target, attribute: str) -> bool:
+    state = inspect(target)
+    return state.pending or state.attrs[attribute].history.has_changes()
+
+
+def _validate(adapter: TypeAdapter, field: str, value):
+    # flush 안에서 난 pydantic 오류는 500 이 되므로 엔드포인트가 422 로 내보낼 수 있는 오류로 바꾼다.
+    try:
+        return adapter.validate_python(value)
+    except ValidationError as exc:
+        raise InvalidFieldError(field, exc.errors(include_url=False, include_context=False)) from exc
+
+
+@event.listens_for(TimeSlot, "before_insert")
+@event.listens_for(TimeSlot, "before_update")
+def sync_weekday_mask(mapper, connection, target: TimeSlot) -> None:
+    # DB에서 읽은 뒤 weekdays 를 바꾸지 않았다면 다시 검증하지 않는다.
+    if not _changed(target, "weekdays"):
+        return
+    mask = weekdays_to_mask(_validate(weekdays_adapter, "weekdays", target.weekdays))
+    target.weekdays = list(mask_to_weekdays(mask))
+    target.weekday_mask = mask
+
+
+@event.listens_for(Calendar, "before_insert")
+@event.listens_for(Calendar, "before_update")
+def validate_topics(mapper, connection, target: Calendar) -> None:
+    if _changed(target, "topics"):
+        target.topics = _validate(topics_adapter, "topics", target.topics)
@@ -0,0 +1,228 @@
+import asyncio
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import delete, event, exists, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+from sqlmodel import select
+
+from appserver.apps.calendar.availability import occurrence_bounds
+from appserver.apps.calendar.bookings import chunked
+from appserver.apps.calendar.models import Booking, Calendar, SlotOccurrence, TimeSlot
+from appserver.db import database, dialect_insert
+from appserver.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "changed_time_slot_ids"
+_PENDING_CALENDAR_KEY = "changed_timezone_calendar_ids"
+_background_tasks: set[asyncio.Task] = set()
+
+# slot_occurrences 를 다시 만든 뒤 해당 캘린더 id 들을 받을 함수들.
+# 커밋 시점에는 아직 재생성 전이므로, 새 일정을 읽어야 하는 곳은 여기에 등록한다.
+occurrence_change_hooks: list[Callable[[set[int]], None]] = []
+
+
+def horizon(today: date | None = None, weeks: int | None = None) -> tuple[date, date]:
+    today = today or datetime.now(timezone.utc).date()
+    weeks = settings.occurrence_horizon_weeks if weeks is None else weeks
+    return today, today + timedelta(weeks=weeks)
+
+
+def expand_occurrences(
+    time_slot: TimeSlot,
+    calendar_timezone: str,
+    start_date: date,
+    end_date: date,
+) -> Iterator[dict]:
+    """시간대를 캘린더 지역 시간으로 펼친 뒤 UTC로 바꾼 행을 만든다.
+
+    서머타임 전환일에도 지역 시각 기준으로 계산하므로 UTC 시각이 하루 단위로 달라질 수 있다.
+    """
+    tz = ZoneInfo(calendar_timezone)
+    weekdays = set(time_slot.weekdays)
+    current = start_date
+    while current <= end_date:
+        if current.weekday() in weekdays:
+            start, end = occurrence_bounds(current, time_slot.start_time, time_slot.end_time)
+            yield dict(
+                time_slot_id=time_slot.id,
+                calendar_id=time_slot.calendar_id,
+                local_date=current,
+                starts_at=start.replace(tzinfo=tz).astimezone(timezone.utc),
+                ends_at=end.replace(tzinfo=tz).astimezone(timezone.utc),
+            )
+        current += timedelta(days=1)
+
+
+async def _insert_occurrences(session: AsyncSession, rows: Iterable[dict]) -> int:
+    count = 0
+    for chunk in chunked(rows):
+        stmt = dialect_insert(session, SlotOccurrence).on_conflict_do_nothing(
+            index_elements=["time_slot_id", "local_date"],
+        )
+        await session.execute(stmt, chunk)
+        count += len(chunk)
+    return count
+
+
+async def regenerate_slot_occurrences(
+    session: AsyncSession,
+    time_slot_ids: Iterable[int],
+    today: date | None = None,
+) -> int:
+    """바뀐 시간대의 앞으로의 일정만 지우고 다시 만든다. 지난 일정은 건드리지 않는다."""
+    time_slot_ids = list(time_slot_ids)
+    if not time_slot_ids:
+        return 0
+    start_date, end_date = horizon(today)
+
+    await session.execute(
+        delete(SlotOccurrence).where(
+            SlotOccurrence.time_slot_id.in_(time_slot_ids),
+            SlotOccurrence.local_date >= start_date,
+        )
+    )
+    result = await session.execute(
+        select(TimeSlot, Calendar.timezone)
+        .join(Calendar, TimeSlot.calendar_id == Calendar.id)
+        .where(TimeSlot.id.in_(time_slot_ids))
+    )
+    rows = (
+        row
+        for time_slot, calendar_timezone in result
+        for row in expand_occurrences(time_slot, calendar_timezone, start_date, end_date)
+    )
+    count = await _insert_occurrences(session, rows)
+    await session.commit()
+    return count
+
+
+async def refresh_horizon(session: AsyncSession, today: date | None = None) -> int:
+    """모든 시간대에 대해 기간 끝까지 빠진 일정을 채우고 지난 일정을 정리한다.
+
+    이미 있는 날짜는 ON CONFLICT DO NOTHING 으로 건너뛰므로 여러 번 실행해도 된다.
+    """
+    start_date, end_date = horizon(today)
+    await session.execute(delete(SlotOccurrence).where(SlotOccurrence.local_date < start_date))
+    result = await session.stream(
+        select(TimeSlot, Calendar.timezone)
+        .join(Calendar, TimeSlot.calendar_id == Calendar.id)
+        .execution_options(yield_per=500)
+    )
+    count = 0
+    async for partition in result.partitions():
+        rows = [
+            row
+            for time_slot, calendar_timezone in partition
+            for row in expand_occurrences(time_slot, calendar_timezone, start_date, end_date)
+        ]
+        count += await _insert_occurrences(session, rows)
+    await session.commit()
+    return count
+
+
+async def get_open_occurrences(
+    session: AsyncSession,
+    calendar_id: int,
+    start: datetime,
+    end: datetime,
+) -> list[SlotOccurrence]:
+    """[start, end) 사이에 시작하는 예약 가능한 일정.
+
+    ix_slot_occurrences_calendar_id_starts_at 범위 검색과
+    uq_time_slot_id_when 인덱스를 쓰는 NOT EXISTS 만으로 끝난다.
+    """
+    booked = exists().where(
+        Booking.time_slot_id == SlotOccurrence.time_slot_id,
+        Booking.when == SlotOccurrence.local_date,
+    )
+    result = await session.scalars(
+        select(SlotOccurrence)
+        .where(
+            SlotOccurrence.calendar_id == calendar_id,
+            SlotOccurrence.starts_at >= start,
+            SlotOccurrence.starts_at < end,
+            ~booked,
+        )
+        .order_by(SlotOccurrence.starts_at)
+    )
+    return list(result)
+
+
+async def _regenerate_in_background(time_slot_ids: set[int], calendar_ids: set[int]) -> None:
+    try:
+        async with database.session_factory() as session:
+            if calendar_ids:
+                result = await session.scalars(
+                    select(TimeSlot.id).where(TimeSlot.calendar_id.in_(calendar_ids))
+                )
+                time_slot_ids = time_slot_ids | set(result)
+            if time_slot_ids:
+                result = await session.scalars(
+                    select(TimeSlot.calendar_id).where(TimeSlot.id.in_(time_slot_ids)).distinct()
+                )
+                calendar_ids = calendar_ids | set(result)
+            await regenerate_slot_occurrences(session, time_slot_ids)
+    except Exception:
+        logger.exception("slot_occurrences 재생성에 실패했습니다: %s", sorted(time_slot_ids))
+        return
+    if calendar_ids:
+        for hook in occurrence_change_hooks:
+            hook(calendar_ids)
+
+
+def schedule_regeneration(time_slot_ids: set[int], calendar_ids: set[int] = frozenset()) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 이벤트 루프 밖(마이그레이션, 스크립트)에서는 다음 refresh_horizon 이 채운다.
+        return
+    task = loop.create_task(_regenerate_in_background(set(time_slot_ids), set(calendar_ids)))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def refresh_periodically(interval: float | None = None) -> None:
+    interval = settings.occurrence_refresh_interval if interval is None else interval
+    while True:
+        try:
+            async with database.session_factory() as session:
+                await refresh_horizon(session)
+        except Exception:
+            logger.exception("slot_occurrences 기간 갱신에 실패했습니다.")
+        await asyncio.sleep(interval)
+
+
+@event.listens_for(TimeSlot, "after_insert")
+@event.listens_for(TimeSlot, "after_update")
+@event.listens_for(TimeSlot, "after_delete")
+def time_slot_changed(mapper, connection, target: TimeSlot) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(Calendar, "after_update")
+def calendar_changed(mapper, connection, target: Calendar) -> None:
+    session = object_session(target)
+    # 시간대가 바뀌면 그 캘린더의 모든 일정을 다시 계산해야 한다.
+    if session is not None and inspect(target).attrs.timezone.history.has_changes():
+        session.info.setdefault(_PENDING_CALENDAR_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def regenerate_after_commit(session: Session) -> None:
+    time_slot_ids = session.info.pop(_PENDING_KEY, None) or set()
+    calendar_ids = session.info.pop(_PENDING_CALENDAR_KEY, None) or set()
+    if time_slot_ids or calendar_ids:
+        schedule_regeneration(time_slot_ids, calendar_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_CALENDAR_KEY, None)
@@ -0,0 +1,122 @@
+from datetime import date
+from typing import Callable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+
+
+def host_calendar_profile(today: date | None = None) -> Sequence[LoaderOption]:
+    """호스트 캘린더 화면: 호스트, 시간대, 오늘 이후의 예약을 함께 읽는다."""
+    today = today or date.today()
+    return (
+        joinedload(Calendar.host),
+        selectinload(Calendar.time_slots)
+        .selectinload(TimeSlot.bookings.and_(Booking.when >= today)),
+    )
+
+
+def calendar_slots_profile(today: date | None = None) -> Sequence[LoaderOption]:
+    """예약 화면: 시간대만 필요하다."""
+    return (
+        selectinload(Calendar.time_slots),
+    )
+
+
+def guest_bookings_profile(today: date | None = None) -> Sequence[LoaderOption]:
+    """게스트의 예약 목록: 예약마다 시간대와 캘린더까지 읽는다."""
+    return (
+        selectinload(User.bookings)
+        .joinedload(Booking.time_slot)
+        .joinedload(TimeSlot.calendar),
+    )
+
+
+def user_with_calendar_profile(today: date | None = None) -> Sequence[LoaderOption]:
+    return (
+        joinedload(User.calendar),
+    )
+
+
+LOADING_PROFILES: dict[str, Callable[[date | None], Sequence[LoaderOption]]] = {
+    "host_calendar": host_calendar_profile,
+    "calendar_slots": calendar_slots_profile,
+    "guest_bookings": guest_bookings_profile,
+    "user_with_calendar": user_with_calendar_profile,
+}
+
+
+def loading_options(profile: str | None, today: date | None = None) -> Sequence[LoaderOption]:
+    if profile is None:
+        return ()
+    try:
+        return LOADING_PROFILES[profile](today)
+    except KeyError:
+        raise ValueError(f"알 수 없는 로딩 프로필입니다: {profile}") from None
+
+
+async def get_calendar_by_host(
+    session: AsyncSession,
+    host_id: int,
+    profile: str | None = "host_calendar",
+    today: date | None = None,
+) -> Calendar | None:
+    stmt = (
+        select(Calendar)
+        .where(Calendar.host_id == host_id)
+        .options(*loading_options(profile, today))
+    )
+    return (await session.scalars(stmt)).unique().one_or_none()
+
+
+async def get_calendar(
+    session: AsyncSession,
+    calendar_id: int,
+    profile: str | None = "calendar_slots",
+    today: date | None = None,
+) -> Calendar | None:
+    stmt = (
+        select(Calendar)
+        .where(Calendar.id == calendar_id)
+        .options(*loading_options(profile, today))
+    )
+    return (await session.scalars(stmt)).unique().one_or_none()
+
+
+async def get_user(
+    session: AsyncSession,
+    user_id: int,
+    profile: str | None = None,
+    today: date | None = None,
+) -> User | None:
+    stmt = (
+        select(User)
+        .where(User.id == user_id)
+        .options(*loading_options(profile, today))
+    )
+    return (await session.scalars(stmt)).unique().one_or_none()
+
+
+def time_slot_calendar_ids(session: Session, time_slot_ids: set[int], chunk_size: int = 500) -> dict[int, int]:
+    """시간대 id 별 캘린더 id. after_flush 같은 세션 이벤트 안에서 동기 세션으로 부른다.
+
+    flush 한 행마다 조회하지 않고 모아 두었다가 IN 쿼리로 한꺼번에 찾는다.
+    같은 flush 에서 지운 시간대는 DB 에 없으므로 session.deleted 에서 찾는다.
+    """
+    found = {
+        obj.id: obj.calendar_id
+        for obj in session.deleted
+        if isinstance(obj, TimeSlot) and obj.id in time_slot_ids
+    }
+    missing = sorted(time_slot_ids - found.keys())
+    for start in range(0, len(missing), chunk_size):
+        rows = session.connection().execute(
+            select(TimeSlot.id, TimeSlot.calendar_id)
+            .where(TimeSlot.id.in_(missing[start:start + chunk_size]))
+        )
+        found.update(rows.all())
+    return found
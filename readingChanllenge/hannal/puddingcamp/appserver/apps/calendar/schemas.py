@@ -0,0 +1,104 @@
+from datetime import date, time
+
+from pydantic import AwareDatetime
+
+from sqlmodel import SQLModel, Field
+
+
+class BookingCreateIn(SQLModel):
+    time_slot_id: int
+    guest_id: int
+    when: date
+    topic: str
+    description: str = ""
+
+
+class BookingOut(SQLModel):
+    id: int
+    when: date
+    topic: str
+    description: str
+    time_slot_id: int
+    guest_id: int
+
+    @classmethod
+    def from_row(cls, booking) -> "BookingOut":
+        """DB에서 읽은 값은 이미 타입이 맞으므로 검증 없이 만든다."""
+        return cls.model_construct(
+            id=booking.id,
+            when=booking.when,
+            topic=booking.topic,
+            description=booking.description,
+            time_slot_id=booking.time_slot_id,
+            guest_id=booking.guest_id,
+        )
+
+
+class BookingPageOut(SQLModel):
+    items: list[BookingOut]
+    next_cursor: str | None = Field(description="다음 페이지를 요청할 때 넘길 값. 마지막 페이지면 null")
+
+
+class BulkBookingIn(SQLModel):
+    bookings: list[BookingCreateIn] = Field(min_length=1, max_length=10000)
+
+
+class RejectedBooking(SQLModel):
+    index: int = Field(description="요청 목록에서의 위치")
+    reason: str
+
+
+class BulkBookingOut(SQLModel):
+    created: int
+    rejected: list[RejectedBooking]
+
+
+class TimeSlotOut(SQLModel):
+    id: int
+    start_time: time
+    end_time: time
+    weekdays: list[int]
+
+    @classmethod
+    def from_row(cls, time_slot) -> "TimeSlotOut":
+        # weekdays 는 저장할 때 검증한 값이다.
+        return cls.model_construct(
+            id=time_slot.id,
+            start_time=time_slot.start_time,
+            end_time=time_slot.end_time,
+            weekdays=time_slot.weekdays,
+        )
+
+
+class CalendarDetailOut(SQLModel):
+    id: int
+    host_id: int
+    topics: list[str]
+    description: str
+    time_slots: list[TimeSlotOut]
+
+    @classmethod
+    def from_row(cls, calendar) -> "CalendarDetailOut":
+        return cls.model_construct(
+            id=calendar.id,
+            host_id=calendar.host_id,
+            topics=calendar.topics,
+            description=calendar.description,
+            time_slots=[TimeSlotOut.from_row(time_slot) for time_slot in calendar.time_slots],
+        )
+
+
+class SlotOccurrenceOut(SQLModel):
+    time_slot_id: int
+    local_date: date
+    starts_at: AwareDatetime
+    ends_at: AwareDatetime
+
+    @classmethod
+    def from_row(cls, occurrence) -> "SlotOccurrenceOut":
+        return cls.model_construct(
+            time_slot_id=occurrence.time_slot_id,
+            local_date=occurrence.local_date,
+            starts_at=occurrence.starts_at,
+            ends_at=occurrence.ends_at,
+        )
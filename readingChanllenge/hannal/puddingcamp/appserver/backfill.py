@@ -0,0 +1,160 @@
+"""마이그레이션에서 큰 테이블을 조금씩 채우는 도구.
+
+한 트랜잭션으로 전체를 UPDATE 하면 그동안 테이블이 잠기므로,
+기본 키 순서로 batch_size 행씩 나눠 각각 커밋하고 사이사이 쉰다.
+진행 위치는 alembic_backfill_progress 테이블에 남겨 두어
+중간에 끊겨도 다음 실행에서 이어서 채운다.
+
+    def upgrade() -> None:
+        add_column_if_missing('time_slots', sa.Column('weekday_mask', ...))
+        with op.get_context().autocommit_block():
+            backfill(op.get_bind(), time_slots, compute_mask, name='time_slots.weekday_mask')
+"""
+import logging
+import time
+from typing import Any, Callable, Mapping
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection, Row
+
+from appserver.settings import settings
+
+logger = logging.getLogger("alembic.backfill")
+
+PROGRESS_TABLE = "alembic_backfill_progress"
+
+progress_metadata = sa.MetaData()
+progress_table = sa.Table(
+    PROGRESS_TABLE,
+    progress_metadata,
+    sa.Column("name", sa.String(128), primary_key=True),
+    sa.Column("last_key", sa.BigInteger(), nullable=False),
+    sa.Column("rows_done", sa.BigInteger(), nullable=False, server_default="0"),
+)
+
+RowValues = Callable[[Row], Mapping[str, Any] | None]
+
+
+def add_column_if_missing(table_name: str, column: sa.Column) -> bool:
+    """backfill 도중 끊긴 마이그레이션을 다시 돌릴 때 컬럼을 두 번 만들지 않는다."""
+    from alembic import op
+
+    columns = {info["name"] for info in sa.inspect(op.get_bind()).get_columns(table_name)}
+    if column.name in columns:
+        return False
+    # SQLite 는 ADD COLUMN 을 바로 지원하지만 다른 변경과 섞일 수 있으므로 batch 모드로 감싼다.
+    with op.batch_alter_table(table_name) as batch_op:
+        batch_op.add_column(column)
+    return True
+
+
+def _load_progress(connection: Connection, name: str) -> tuple[int | None, int]:
+    progress_metadata.create_all(connection, checkfirst=True)
+    row = connection.execute(
+        sa.select(progress_table.c.last_key, progress_table.c.rows_done)
+        .where(progress_table.c.name == name)
+    ).one_or_none()
+    return (row.last_key, row.rows_done) if row is not None else (None, 0)
+
+
+def _save_progress(connection: Connection, name: str, last_key: int, rows_done: int) -> None:
+    updated = connection.execute(
+        progress_table.update()
+        .where(progress_table.c.name == name)
+        .values(last_key=last_key, rows_done=rows_done)
+    )
+    if updated.rowcount == 0:
+        connection.execute(progress_table.insert().values(name=name, last_key=last_key, rows_done=rows_done))
+
+
+def backfill(
+    connection: Connection,
+    table: sa.TableClause,
+    values: RowValues | Mapping[str, Any],
+    *,
+    name: str,
+    key: str = "id",
+    columns: list[str] | None = None,
+    where: sa.ColumnElement[bool] | None = None,
+    batch_size: int | None = None,
+    sleep: float | None = None,
+) -> int:
+    """table 을 key 순서로 나눠 채우고 처리한 행 수를 돌려준다.
+
+    values 가 매핑이면 SQL 식 그대로 범위 UPDATE 한 번으로 처리하고,
+    함수이면 행마다 새 값을 계산해 executemany 로 쓴다. None 을 돌려준 행은 건너뛴다.
+    autocommit_block 안에서 불러야 배치마다 커밋된다. 트랜잭션 안에서 부르면
+    잠금은 그대로지만 진행 위치 기록과 나눠 쓰기는 똑같이 동작한다.
+    """
+    batch_size = batch_size or settings.backfill_batch_size
+    sleep = settings.backfill_sleep if sleep is None else sleep
+    key_column = table.c[key]
+
+    last_key, rows_done = _load_progress(connection, name)
+    if last_key is not None:
+        logger.info("%s: %s 이후부터 이어서 채웁니다 (%d행 완료).", name, last_key, rows_done)
+
+    remaining_query = sa.select(sa.func.count()).select_from(table)
+    if last_key is not None:
+        remaining_query = remaining_query.where(key_column > last_key)
+    if where is not None:
+        remaining_query = remaining_query.where(where)
+    total = rows_done + connection.scalar(remaining_query)
+
+    if callable(values):
+        selected = [key_column, *(table.c[column] for column in columns or ())]
+    else:
+        selected = [key_column]
+    started_at = time.monotonic()
+    started_rows = rows_done
+
+    while True:
+        query = sa.select(*selected).order_by(key_column).limit(batch_size)
+        if last_key is not None:
+            query = query.where(key_column > last_key)
+        if where is not None:
+            query = query.where(where)
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+        upper = rows[-1][0]
+
+        if callable(values):
+            params = []
+            for row in rows:
+                new_values = values(row)
+                if new_values is not None:
+                    params.append({"_key": row[0], **new_values})
+            if params:
+                bind_names = [column for column in params[0] if column != "_key"]
+                connection.execute(
+                    table.update()
+                    .where(key_column == sa.bindparam("_key"))
+                    .values({column: sa.bindparam(column) for column in bind_names}),
+                    params,
+                )
+        else:
+            statement = table.update().where(key_column <= upper).values(dict(values))
+            if last_key is not None:
+                statement = statement.where(key_column > last_key)
+            if where is not None:
+                statement = statement.where(where)
+            connection.execute(statement)
+
+        last_key = upper
+        rows_done += len(rows)
+        _save_progress(connection, name, last_key, rows_done)
+
+        elapsed = time.monotonic() - started_at
+        rate = (rows_done - started_rows) / elapsed if elapsed else 0
+        logger.info(
+            "%s: %d/%d행 (%.1f%%), %.0f행/초",
+            name, rows_done, total, 100 * rows_done / total if total else 100, rate,
+        )
+        if len(rows) < batch_size:
+            break
+        if sleep:
+            time.sleep(sleep)
+
+    connection.execute(progress_table.delete().where(progress_table.c.name == name))
+    return rows_done
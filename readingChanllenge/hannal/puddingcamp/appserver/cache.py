@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class Cache(Protocol):
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any) -> None: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    def invalidate(self, *keys: str) -> None:
+        """이벤트 리스너처럼 await 할 수 없는 곳에서 키를 지운다."""
+        ...
+
+
+class LRUCache:
+    """프로세스 안에서 쓰는 TTL 기반 LRU 캐시."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def get(self, key: str) -> Any | None:
+        return self.get_nowait(key)
+
+    def get_nowait(self, key: str) -> Any | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self.set_nowait(key, value)
+
+    def set_nowait(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self._items[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        self.invalidate(*keys)
+
+    def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class RedisCache:
+    """redis.asyncio.Redis 와 같은 get/set/delete 를 제공하는 클라이언트를 감싼다.
+
+    테스트에서는 같은 메서드를 가진 가짜 클라이언트를 넘기면 된다.
+    """
+
+    def __init__(self, client: Any, ttl: float = 60, prefix: str = "pudding:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self._pending: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError("Redis 캐시를 쓰려면 redis 패키지를 설치해야 합니다.") from exc
+        return cls(Redis.from_url(url), **kwargs)
+
+    async def get(self, key: str) -> Any | None:
+        value = await self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value), ex=int(self.ttl))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    def invalidate(self, *keys: str) -> None:
+        task = asyncio.get_running_loop().create_task(self.delete(*keys))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
+def create_cache(backend: str, url: str | None = None, maxsize: int = 1024, ttl: float = 60) -> Cache:
+    if backend == "memory":
+        return LRUCache(maxsize=maxsize, ttl=ttl)
+    if backend == "redis":
+        if not url:
+            raise ValueError("Redis 캐시에는 cache_url 설정이 필요합니다.")
+        return RedisCache.from_url(url, ttl=ttl)
+    raise ValueError(f"알 수 없는 캐시 백엔드입니다: {backend}")
@@ -1,3 +1,6 @@
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import(
     create_async_engine,
     async_sessionmaker,
@@ -5,11 +8,62 @@ from sqlalchemy.ext.asyncio import(
     AsyncEngine,
 )
 
-def create_engine(dsn: str):
-    return create_async_engine(
-        dsn,
-        echo=True,
-    )
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from appserver.metrics import instrument_engine
+from appserver.settings import Settings, settings
+
+
+def _is_sqlite_memory(database: str | None) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+def _orjson_dumps(value) -> str:
+    return orjson.dumps(value).decode()
+
+
+def create_engine(dsn: str, config: Settings = settings) -> AsyncEngine:
+    url = make_url(dsn)
+    options = {
+        "echo": config.echo,
+        "query_cache_size": config.query_cache_size,
+    }
+    backend = url.get_backend_name()
+
+    # topics/weekdays 같은 JSON 컬럼은 행을 읽을 때마다 디코딩하므로 더 빠른 구현을 쓴다.
+    if orjson is not None:
+        options.update(json_serializer=_orjson_dumps, json_deserializer=orjson.loads)
+
+    # 메모리 SQLite는 StaticPool을 쓰므로 풀 크기 관련 옵션을 받지 않는다.
+    if not (backend == "sqlite" and _is_sqlite_memory(url.database)):
+        options.update(
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+        )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": config.statement_cache_size,
+        }
+
+    async_engine = create_async_engine(url, **options)
+
+    if backend == "sqlite":
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            if not _is_sqlite_memory(url.database):
+                cursor.execute(f"PRAGMA journal_mode={config.sqlite_journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={config.sqlite_synchronous}")
+            cursor.close()
+
+    instrument_engine(async_engine)
+    return async_engine
 
 def create_session(async_engine: AsyncEngine | None = None):
     if async_engine is None:
@@ -21,12 +75,85 @@ def create_session(async_engine: AsyncEngine | None = None):
         class_=AsyncSession,
     )
 
+# ON CONFLICT 절을 쓸 수 있는 방언별 insert
+DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(session: AsyncSession, table):
+    return DIALECT_INSERTS[session.bind.dialect.name](table)
+
+
+class Database:
+    """엔진과 세션 팩토리를 처음 쓰는 시점에 만든다.
+
+    모듈을 import 하는 것만으로는 연결 풀을 만들지 않으므로
+    CLI나 마이그레이션처럼 DB를 쓰지 않는 경로의 시작 비용이 줄어든다.
+    """
+
+    def __init__(self, config: Settings = settings):
+        self.config = config
+        self._engine: AsyncEngine | None = None
+        self._read_engine: AsyncEngine | None = None
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._read_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_engine(self.config.dsn, self.config)
+        return self._engine
+
+    @property
+    def read_engine(self) -> AsyncEngine:
+        if self._read_engine is None:
+            if self.config.replica_dsn:
+                self._read_engine = create_engine(self.config.replica_dsn, self.config)
+            else:
+                self._read_engine = self.engine
+        return self._read_engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            self._session_factory = create_session(self.engine)
+        return self._session_factory
+
+    @property
+    def read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._read_session_factory is None:
+            if self.read_engine is self.engine:
+                self._read_session_factory = self.session_factory
+            else:
+                self._read_session_factory = create_session(self.read_engine)
+        return self._read_session_factory
+
+    def connect(self) -> None:
+        self.engine
+        self.read_engine
+
+    async def dispose(self) -> None:
+        if self._read_engine is not None and self._read_engine is not self._engine:
+            await self._read_engine.dispose()
+        if self._engine is not None:
+            await self._engine.dispose()
+        self._engine = None
+        self._read_engine = None
+        self._session_factory = None
+        self._read_session_factory = None
+
+
 async def use_session():
-    async with async_session_factory() as session:
+    async with database.session_factory() as session:
         yield session
 
-DSN = "sqlite+aiosqlite:/// ./local.db"
+async def use_read_session():
+    """읽기 전용 요청에서 사용한다. 복제본이 없으면 쓰기용 엔진을 그대로 쓴다."""
+    async with database.read_session_factory() as session:
+        yield session
 
-engine = create_engine(DSN)
+DSN = settings.dsn
 
-async_session_factory = create_session(engine)
\ No newline at end of file
+database = Database(settings)
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import random
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[Hashable, list[Any]], Awaitable[None]]
+
+
+class CoalescingJobRunner:
+    """그룹별로 작업을 모아 일정한 수의 워커가 묶음 단위로 처리한다.
+
+    - 같은 그룹, 같은 키로 들어온 작업은 마지막 것만 남긴다.
+    - 한 그룹은 한 번에 한 워커만 처리하므로 그룹 안의 순서가 섞이지 않는다.
+    - 처리 중 예외가 나면 지수 백오프로 다시 시도한다. 그 사이 새로 들어온 작업이 우선한다.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        *,
+        workers: int = 4,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60,
+        name: str = "jobs",
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.name = name
+
+        self._pending: dict[Hashable, OrderedDict[Hashable, Any]] = {}
+        self._attempts: dict[Hashable, int] = {}
+        self._ready: asyncio.Queue[Hashable] | None = None
+        self._scheduled: set[Hashable] = set()
+        self._running: set[Hashable] = set()
+        self._backing_off: set[Hashable] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._timers: set[asyncio.TimerHandle] = set()
+
+    @property
+    def started(self) -> bool:
+        return bool(self._tasks)
+
+    def pending_count(self) -> int:
+        return sum(len(items) for items in self._pending.values())
+
+    def submit(self, group: Hashable, key: Hashable, payload: Any) -> None:
+        items = self._pending.setdefault(group, OrderedDict())
+        items.pop(key, None)
+        items[key] = payload
+        self._schedule(group)
+
+    def _schedule(self, group: Hashable) -> None:
+        if self._ready is None or group in self._scheduled or group in self._running:
+            return
+        if group in self._backing_off:
+            return
+        self._scheduled.add(group)
+        self._ready.put_nowait(group)
+
+    async def start(self) -> None:
+        if self.started:
+            return
+        self._ready = asyncio.Queue()
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._work(), name=f"{self.name}-{index}"))
+        # 시작 전에 들어온 작업도 처리한다.
+        for group in list(self._pending):
+            self._schedule(group)
+
+    async def join(self) -> None:
+        """대기 중인 작업과 재시도 예정 작업이 모두 끝날 때까지 기다린다."""
+        while self._pending or self._running or self._backing_off:
+            await asyncio.sleep(0.01)
+
+    async def stop(self, drain: bool = True) -> None:
+        if drain and self.started:
+            await self.join()
+        for timer in self._timers:
+            timer.cancel()
+        self._timers.clear()
+        self._backing_off.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._ready = None
+        self._scheduled.clear()
+
+    async def _work(self) -> None:
+        while True:
+            group = await self._ready.get()
+            self._scheduled.discard(group)
+            items = self._pending.get(group)
+            if not items:
+                self._pending.pop(group, None)
+                continue
+
+            batch = OrderedDict()
+            while items and len(batch) < self.batch_size:
+                key, payload = items.popitem(last=False)
+                batch[key] = payload
+            if not items:
+                del self._pending[group]
+
+            self._running.add(group)
+            try:
+                await self.handler(group, list(batch.values()))
+            except asyncio.CancelledError:
+                self._requeue(group, batch)
+                raise
+            except Exception:
+                self._retry(group, batch)
+            else:
+                self._attempts.pop(group, None)
+            finally:
+                self._running.discard(group)
+            if group in self._pending:
+                self._schedule(group)
+
+    def _requeue(self, group: Hashable, batch: OrderedDict) -> None:
+        items = self._pending.setdefault(group, OrderedDict())
+        for key, payload in reversed(batch.items()):
+            # 재시도를 기다리는 사이 같은 키로 새 작업이 들어왔으면 새 작업을 남긴다.
+            items.setdefault(key, payload)
+            items.move_to_end(key, last=False)
+
+    def _retry(self, group: Hashable, batch: OrderedDict) -> None:
+        attempt = self._attempts.get(group, 0) + 1
+        if attempt >= self.max_attempts:
+            logger.exception("%s: 그룹 %r 작업 %d건을 %d번 실패해 버립니다.", self.name, group, len(batch), attempt)
+            self._attempts.pop(group, None)
+            return
+        self._attempts[group] = attempt
+        self._requeue(group, batch)
+        self._backing_off.add(group)
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay *= random.uniform(0.5, 1.0)
+        logger.warning("%s: 그룹 %r 처리 실패, %.1f초 뒤 다시 시도합니다 (%d번째).", self.name, group, delay, attempt)
+
+        def wake() -> None:
+            self._timers.discard(timer)
+            self._backing_off.discard(group)
+            self._schedule(group)
+
+        timer = asyncio.get_running_loop().call_later(delay, wake)
+        self._timers.add(timer)
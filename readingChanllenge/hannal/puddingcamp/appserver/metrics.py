@@ -0,0 +1,178 @@
+import logging
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from appserver.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass(slots=True)
+class RequestStats:
+    query_count: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.query_count += 1
+        self.db_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+# 시작 시각은 연결이 아니라 실행 컨텍스트에 둔다. 문장이 실패하면 after_cursor_execute 가
+# 불리지 않으므로, 연결에 남겨 두면 풀에 돌아간 연결에 지난 값이 쌓인다.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = time.perf_counter()
+
+
+def _record(context, statement: str) -> None:
+    started_at = getattr(context, "_query_started_at", None)
+    stats = _current_stats.get()
+    if started_at is not None and stats is not None:
+        stats.record(statement, time.perf_counter() - started_at)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record(context, statement)
+
+
+def _handle_error(exception_context) -> None:
+    # 실패한 문장(예: 예약 충돌로 난 IntegrityError)도 DB 시간을 쓴 것이므로 센다.
+    if exception_context.execution_context is not None:
+        _record(exception_context.execution_context, exception_context.statement)
+
+
+def instrument_engine(async_engine: AsyncEngine) -> None:
+    """엔진이 실행하는 SQL마다 소요 시간을 현재 요청의 통계에 더한다."""
+    sync_engine = async_engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(sync_engine, "handle_error", _handle_error)
+
+
+@dataclass(slots=True)
+class RouteMetrics:
+    count: int = 0
+    latency_sum: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    query_count_sum: int = 0
+    db_time_sum: float = 0.0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.routes: dict[tuple[str, str, int], RouteMetrics] = defaultdict(RouteMetrics)
+
+    def observe(self, method: str, path: str, status: int, latency: float, stats: RequestStats) -> None:
+        metrics = self.routes[(method, path, status)]
+        metrics.count += 1
+        metrics.latency_sum += latency
+        index = bisect_left(LATENCY_BUCKETS, latency)
+        if index < len(LATENCY_BUCKETS):
+            metrics.latency_buckets[index] += 1
+        metrics.query_count_sum += stats.query_count
+        metrics.db_time_sum += stats.db_time
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds 요청 처리 시간",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, path, status), metrics in sorted(self.routes.items()):
+            labels = f'method="{method}",path="{path}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.latency_buckets):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {metrics.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {metrics.latency_sum}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {metrics.count}")
+
+        lines += [
+            "# HELP http_request_db_queries_total 요청에서 실행한 SQL 문 수",
+            "# TYPE http_request_db_queries_total counter",
+        ]
+        for (method, path, status), metrics in sorted(self.routes.items()):
+            labels = f'method="{method}",path="{path}",status="{status}"'
+            lines.append(f"http_request_db_queries_total{{{labels}}} {metrics.query_count_sum}")
+
+        lines += [
+            "# HELP http_request_db_seconds_total 요청에서 SQL 실행에 쓴 시간",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for (method, path, status), metrics in sorted(self.routes.items()):
+            labels = f'method="{method}",path="{path}",status="{status}"'
+            lines.append(f"http_request_db_seconds_total{{{labels}}} {metrics.db_time_sum}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class PerformanceMiddleware:
+    """요청마다 지연 시간과 SQL 통계를 모아 Server-Timing 헤더와 /metrics 로 내보낸다."""
+
+    def __init__(self, app, registry: MetricsRegistry = registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_stats.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - started_at
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(elapsed, stats).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            elapsed = time.perf_counter() - started_at
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "<unmatched>"
+            self.registry.observe(scope["method"], path, status_code, elapsed, stats)
+            if stats.slowest_time * 1000 >= settings.slow_query_ms:
+                logger.warning(
+                    "느린 쿼리 %.1fms (%s %s): %s",
+                    stats.slowest_time * 1000,
+                    scope["method"],
+                    path,
+                    stats.slowest_statement,
+                )
+
+
+def server_timing(elapsed: float, stats: RequestStats) -> str:
+    return ", ".join([
+        f"app;dur={elapsed * 1000:.2f}",
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.query_count} queries"',
+        f"db-slowest;dur={stats.slowest_time * 1000:.2f}",
+    ])
+
@@ -0,0 +1,39 @@
+import inspect
+from typing import Any
+
+from fastapi import routing
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class PydanticJSONResponse(Response):
+    """pydantic 모델(또는 그 목록)을 Rust 직렬화기로 곧장 bytes로 만든다.
+
+    엔드포인트가 이 응답을 직접 돌려주면 FastAPI의 응답 검증과
+    jsonable_encoder/dict 변환 단계를 모두 건너뛴다.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def _fastapi_dumps_json_directly() -> bool:
+    # 최근 FastAPI는 응답 모델이 있으면 기본 응답 클래스에서 pydantic으로 바로 JSON을 만든다.
+    # 이때 응답 클래스를 바꾸면 오히려 그 빠른 경로를 끄게 된다.
+    return "dump_json" in inspect.signature(routing.serialize_response).parameters
+
+
+def default_response_class() -> type[Response] | None:
+    if _fastapi_dumps_json_directly():
+        return None
+    if orjson is not None:
+        from fastapi.responses import ORJSONResponse
+        return ORJSONResponse
+    return JSONResponse
@@ -0,0 +1,80 @@
+import os
+
+from pydantic import BaseModel
+
+
+class Settings(BaseModel):
+    dsn: str = "sqlite+aiosqlite:///./local.db"
+    replica_dsn: str | None = None
+
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # SQLAlchemy가 컴파일한 SQL을 보관하는 캐시 크기
+    query_cache_size: int = 500
+    # asyncpg가 연결마다 유지하는 prepared statement 캐시 크기
+    statement_cache_size: int = 500
+
+    # "memory" 또는 "redis"
+    cache_backend: str = "memory"
+    cache_url: str | None = None
+    cache_ttl: float = 60
+    cache_maxsize: int = 1024
+
+    # slot_occurrences 를 미리 만들어 둘 기간(주)과 기간을 다시 채우는 주기(초)
+    occurrence_horizon_weeks: int = 8
+    occurrence_refresh_interval: float = 3600
+
+    google_sync_enabled: bool = False
+    google_calendar_api_url: str = "https://www.googleapis.com/calendar/v3"
+    google_api_token: str | None = None
+    google_sync_workers: int = 4
+    google_sync_batch_size: int = 50
+    google_sync_max_attempts: int = 6
+
+    # scrypt 비용 인자(N, r, p)와 해시 계산에 쓸 스레드 수
+    password_scrypt_n: int = 2**14
+    password_scrypt_r: int = 8
+    password_scrypt_p: int = 1
+    password_hash_workers: int = 4
+
+    # OAuth 로그인 조회 캐시. 없는 계정도 잠깐 기억해 콜백이 몰릴 때 DB를 덜 두드린다.
+    oauth_cache_ttl: float = 30
+    oauth_negative_cache_ttl: float = 5
+    oauth_cache_maxsize: int = 10000
+
+    # 마이그레이션 backfill 한 번에 고칠 행 수와 배치 사이에 쉴 시간(초)
+    backfill_batch_size: int = 1000
+    backfill_sleep: float = 0.05
+
+    # when 이 이 일수보다 지난 예약은 bookings_archive 로 옮긴다.
+    booking_archive_after_days: int = 365
+    booking_archive_batch_size: int = 5000
+    booking_archive_interval: float = 86400
+
+    # 실시간 예약 가능 시간 스트림: 보여 줄 기간(일), 하트비트 간격(초), 최대 동시 연결 수
+    availability_stream_days: int = 14
+    availability_stream_heartbeat: float = 15
+    availability_stream_max_subscribers: int = 10000
+
+    # 이보다 오래 걸린 SQL은 경고 로그로 남긴다.
+    slow_query_ms: float = 200
+
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+
+    @classmethod
+    def from_env(cls, prefix: str = "PUDDING_") -> "Settings":
+        """PUDDING_POOL_SIZE 처럼 접두사를 붙인 환경 변수에서 설정을 읽는다."""
+        values = {}
+        for name in cls.model_fields:
+            key = f"{prefix}{name.upper()}"
+            if key in os.environ:
+                values[name] = os.environ[key]
+        return cls.model_validate(values)
+
+
+settings = Settings.from_env()
@@ -0,0 +1,45 @@
+"""벤치마크가 쓸 DB 를 고른다.
+
+벤치마크는 시드 전에 스키마를 지우고 다시 만들기 때문에 PUDDING_DSN 을 따르지 않고
+기본으로 임시 SQLite 파일을 쓴다. 다른 DB 는 --dsn 으로 직접 지정해야 하며,
+이미 테이블이 있는 DB 는 --reset-db 를 함께 줘야만 지운다.
+
+appserver 가 import 될 때 설정을 읽으므로 use_benchmark_database() 는
+appserver 를 import 하기 전에 불러야 한다.
+"""
+import argparse
+import os
+import tempfile
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import SQLModel
+
+
+def add_database_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--dsn", help="임시 SQLite 대신 쓸 DB (PUDDING_DSN 은 무시한다)")
+    parser.add_argument("--reset-db", action="store_true", help="--dsn 에 이미 있는 테이블을 지우고 다시 만든다")
+
+
+def use_benchmark_database(name: str) -> None:
+    parser = argparse.ArgumentParser(add_help=False)
+    add_database_arguments(parser)
+    args, _ = parser.parse_known_args()
+    if args.dsn:
+        os.environ["PUDDING_DSN"] = args.dsn
+    else:
+        db_dir = tempfile.mkdtemp(prefix=f"pudding-{name}-")
+        os.environ["PUDDING_DSN"] = f"sqlite+aiosqlite:///{db_dir}/{name}.db"
+    # 시드한 데이터가 없는 복제본에서 읽지 않도록 읽기 전용 엔진도 같은 DB 를 쓰게 한다.
+    os.environ.pop("PUDDING_REPLICA_DSN", None)
+
+
+async def recreate_schema(connection: AsyncConnection, reset: bool) -> None:
+    tables = await connection.run_sync(lambda sync_connection: inspect(sync_connection).get_table_names())
+    if tables and not reset:
+        raise SystemExit(
+            f"{connection.engine.url} 에 이미 테이블이 있습니다({len(tables)}개). "
+            "지워도 되는 DB 라면 --reset-db 를 함께 지정하세요."
+        )
+    await connection.run_sync(SQLModel.metadata.drop_all)
+    await connection.run_sync(SQLModel.metadata.create_all)
@@ -0,0 +1,136 @@
+"""예약 보관(bookings_archive) 전후의 조회 지연 시간을 비교한다.
+
+    python -m benchmarks.archive --rows 1000000
+    python -m benchmarks.archive --rows 10000000 --repeat 50   # 오래 걸린다
+
+과거 10년치 예약을 채운 뒤 최근 예약 조회를 재고, 보관 기준일 이전 예약을
+bookings_archive 로 옮긴 다음 같은 조회를 다시 잰다.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import date, time as dt_time, timedelta
+from statistics import median
+
+from benchmarks._database import add_database_arguments, recreate_schema, use_benchmark_database
+
+use_benchmark_database("archive")
+
+from sqlalchemy import func, insert
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.archive import archive_bookings, archive_cutoff, get_bookings_between
+from appserver.apps.calendar.models import Booking, BookingArchive, Calendar, TimeSlot, weekdays_to_mask
+from appserver.db import database
+
+HISTORY_DAYS = 3650
+FUTURE_DAYS = 60
+GUESTS = 1000
+CHUNK = 10000
+
+
+async def seed(rows: int, today: date, reset: bool = False) -> int:
+    days = HISTORY_DAYS + FUTURE_DAYS
+    slots = -(-rows // days)
+    first_day = today - timedelta(days=HISTORY_DAYS)
+    async with database.engine.begin() as connection:
+        await recreate_schema(connection, reset)
+        await connection.execute(insert(User), [
+            dict(username=f"user{index}", email=f"user{index}@example.com", display_name="사용자", password="x", is_host=index == 0)
+            for index in range(GUESTS + 1)
+        ])
+        await connection.execute(insert(Calendar), [
+            dict(host_id=1, topics=["커리어"], description="", google_calendar_id="archive")
+        ])
+        everyday = list(range(7))
+        await connection.execute(insert(TimeSlot), [
+            dict(calendar_id=1, start_time=dt_time(index % 24), end_time=dt_time((index + 1) % 24),
+                 weekdays=everyday, weekday_mask=weekdays_to_mask(everyday))
+            for index in range(slots)
+        ])
+
+    def generate():
+        for offset in range(days):
+            when = first_day + timedelta(days=offset)
+            for time_slot_id in range(1, slots + 1):
+                yield dict(time_slot_id=time_slot_id, guest_id=random.randint(2, GUESTS + 1),
+                           when=when, topic="커리어", description="")
+
+    inserted = 0
+    batch = []
+    started_at = time.perf_counter()
+    for row in generate():
+        batch.append(row)
+        if len(batch) == CHUNK:
+            async with database.engine.begin() as connection:
+                await connection.execute(insert(Booking), batch)
+            inserted += len(batch)
+            batch = []
+            if inserted >= rows:
+                break
+            if inserted % (CHUNK * 100) == 0:
+                print(f"  {inserted:,} rows ({inserted / (time.perf_counter() - started_at):,.0f} rows/s)")
+    if batch:
+        async with database.engine.begin() as connection:
+            await connection.execute(insert(Booking), batch)
+        inserted += len(batch)
+    return inserted
+
+
+async def measure(repeat: int, today: date) -> dict[str, float]:
+    queries = {
+        # when 만으로 거르는 조회는 bookings 전체를 훑으므로 테이블 크기에 비례한다.
+        "upcoming (all guests)": lambda session: get_bookings_between(session, today, today + timedelta(days=7), today=today),
+        "upcoming (one guest)": lambda session: get_bookings_between(
+            session, today, today + timedelta(days=30), guest_id=random.randint(2, GUESTS + 1), today=today),
+        "last year (one guest)": lambda session: get_bookings_between(
+            session, today - timedelta(days=730), today - timedelta(days=365), guest_id=random.randint(2, GUESTS + 1), today=today),
+    }
+    results = {}
+    async with database.session_factory() as session:
+        for name, query in queries.items():
+            timings = []
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                await query(session)
+                timings.append(time.perf_counter() - started_at)
+            results[name] = median(timings) * 1000
+    return results
+
+
+async def main_async(rows: int, repeat: int, reset: bool) -> int:
+    today = date.today()
+    print(f"seeding {rows:,} bookings over {HISTORY_DAYS} days of history")
+    inserted = await seed(rows, today, reset)
+
+    before = await measure(repeat, today)
+    started_at = time.perf_counter()
+    async with database.session_factory() as session:
+        moved = await archive_bookings(session, before=archive_cutoff(today))
+        hot = await session.scalar(select(func.count()).select_from(Booking))
+        cold = await session.scalar(select(func.count()).select_from(BookingArchive))
+    archived_in = time.perf_counter() - started_at
+    after = await measure(repeat, today)
+    await database.dispose()
+
+    print(f"archived {moved:,} of {inserted:,} rows in {archived_in:.1f}s (bookings {hot:,}, archive {cold:,})")
+    print(f"{'query':<24}{'before ms':>12}{'after ms':>12}")
+    for name in before:
+        print(f"{name:<24}{before[name]:>12.2f}{after[name]:>12.2f}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args.rows, args.repeat, args.reset_db))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Calendar / TimeSlot 행 하나를 읽어 응답 모델로 만드는 데 드는 시간을 잰다.
+
+    python -m benchmarks.hydration --calendars 2000 --slots-per-calendar 10
+
+JSON 디코더(json / orjson)와 응답 모델 생성 방식(model_validate / from_row)을
+바꿔 가며 같은 조회를 반복하고 행당 마이크로초를 출력한다.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from datetime import time as dt_time
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlmodel import SQLModel, select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar, TimeSlot, weekdays_to_mask
+from appserver.apps.calendar.schemas import CalendarDetailOut, TimeSlotOut
+from appserver.db import create_engine
+
+TOPICS = ["커리어", "코드 리뷰", "이력서", "면접 준비", "사이드 프로젝트"]
+
+
+async def seed(engine, calendars: int, slots_per_calendar: int) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+        await connection.execute(insert(User), [
+            dict(username=f"host{index}", email=f"host{index}@example.com", display_name="호스트", password="x", is_host=True)
+            for index in range(calendars)
+        ])
+        await connection.execute(insert(Calendar), [
+            dict(host_id=index + 1, topics=TOPICS, description="설명", google_calendar_id=f"calendar-{index}")
+            for index in range(calendars)
+        ])
+        time_slots = []
+        for calendar_id in range(1, calendars + 1):
+            for index in range(slots_per_calendar):
+                weekdays = [index % 7, (index + 3) % 7]
+                time_slots.append(dict(
+                    calendar_id=calendar_id,
+                    start_time=dt_time(8 + index % 10),
+                    end_time=dt_time(9 + index % 10),
+                    weekdays=sorted(weekdays),
+                    weekday_mask=weekdays_to_mask(weekdays),
+                ))
+        await connection.execute(insert(TimeSlot), time_slots)
+
+
+async def timed(engine, load, convert, repeat: int) -> tuple[float, int]:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started_at = time.perf_counter()
+            items = (await session.scalars(load())).all()
+            converted = [convert(item) for item in items]
+            best = min(best, time.perf_counter() - started_at)
+            rows = len(converted)
+    return best, rows
+
+
+async def main_async(calendars: int, slots_per_calendar: int, repeat: int) -> int:
+    path = f"{tempfile.mkdtemp(prefix='pudding-hydration-')}/hydration.db"
+    dsn = f"sqlite+aiosqlite:///{path}"
+    tuned = create_engine(dsn)
+    baseline = create_async_engine(dsn, json_deserializer=json.loads)
+    await seed(tuned, calendars, slots_per_calendar)
+
+    def load_calendars():
+        return select(Calendar).options(selectinload(Calendar.time_slots))
+
+    def load_time_slots():
+        return select(TimeSlot)
+
+    cases = [
+        ("Calendar", load_calendars, calendars + calendars * slots_per_calendar, {
+            "before": (baseline, lambda calendar: CalendarDetailOut.model_validate(calendar, from_attributes=True)),
+            "after": (tuned, CalendarDetailOut.from_row),
+        }),
+        ("TimeSlot", load_time_slots, calendars * slots_per_calendar, {
+            "before": (baseline, lambda time_slot: TimeSlotOut.model_validate(time_slot, from_attributes=True)),
+            "after": (tuned, TimeSlotOut.from_row),
+        }),
+    ]
+    print(f"{'model':<10}{'variant':<10}{'us/row':>10}")
+    for name, load, row_count, variants in cases:
+        for variant, (engine, convert) in variants.items():
+            elapsed, _ = await timed(engine, load, convert, repeat)
+            print(f"{name:<10}{variant:<10}{elapsed / row_count * 1e6:>10.2f}")
+
+    await tuned.dispose()
+    await baseline.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calendars", type=int, default=2000)
+    parser.add_argument("--slots-per-calendar", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args.calendars, args.slots_per_calendar, args.repeat))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
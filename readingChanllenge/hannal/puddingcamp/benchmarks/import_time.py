@@ -0,0 +1,70 @@
+"""모듈 import 시간을 python -X importtime 으로 잰다.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time appserver.app --max-ms 800
+
+--max-ms 를 넘기면 0이 아닌 코드로 끝나므로 CI에서 회귀를 잡을 수 있다.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = ("appserver.settings", "appserver.db", "appserver.app")
+
+
+def measure(module: str, repeat: int = 5) -> tuple[float, list[tuple[str, int]]]:
+    """가장 빠른 실행의 누적 import 시간(ms)과 바로 아래 하위 모듈별 시간을 돌려준다."""
+    best_total = None
+    best_children: list[tuple[str, int]] = []
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.getcwd(), os.environ.get("PYTHONPATH")]))}
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        # 하위 모듈이 부모보다 먼저, 두 칸 더 들여써서 출력된다.
+        children = []
+        total = 0
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            indent = len(name) - len(name.lstrip()) - 1
+            if indent == 2:
+                children.append((name.strip(), int(cumulative)))
+            elif indent == 0:
+                if name.strip() == module:
+                    total = int(cumulative)
+                    break
+                children = []
+        if best_total is None or total < best_total:
+            best_total = total
+            best_children = sorted(children, key=lambda item: item[1], reverse=True)
+    return best_total / 1000, best_children
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--max-ms", type=float, default=None, help="이 시간을 넘으면 실패로 처리한다")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        total_ms, children = measure(module, args.repeat)
+        print(f"{module}: {total_ms:.1f} ms")
+        for name, us in children[:5]:
+            print(f"  {name:<40} {us / 1000:8.1f} ms")
+        if args.max_ms is not None and total_ms > args.max_ms:
+            print(f"  -> {args.max_ms:.1f} ms 예산을 넘었습니다.")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""예약 서비스 부하 테스트.
+
+호스트/캘린더/시간대/예약을 미리 채운 뒤 여러 비동기 클라이언트로
+FastAPI 앱을 호출하고 엔드포인트별 처리량과 p50/p95/p99 지연 시간을 출력한다.
+
+    python -m benchmarks.load --hosts 50 --concurrency 32 --duration 10
+    python -m benchmarks.load --save-baseline benchmarks/baseline.json
+    python -m benchmarks.load --baseline benchmarks/baseline.json --tolerance 0.2
+
+기본으로 임시 SQLite 파일을 쓴다. 다른 DB(예: 로컬 Postgres)는 --dsn 으로 지정하고,
+테이블이 이미 있으면 지워도 되는 DB 일 때만 --reset-db 를 함께 준다.
+--baseline 과 비교해 처리량이 줄거나 p95 가 tolerance 보다 많이 늘면 1로 끝난다.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, time as dt_time, timedelta
+from pathlib import Path
+from statistics import quantiles
+
+from benchmarks._database import add_database_arguments, recreate_schema, use_benchmark_database
+
+use_benchmark_database("load")
+
+import httpx
+from sqlalchemy import insert
+
+from appserver.app import app
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot, weekdays_to_mask
+from appserver.db import database
+
+
+async def seed(hosts: int, slots_per_host: int, bookings_per_slot: int, guests: int, reset: bool = False) -> dict:
+    async with database.engine.begin() as connection:
+        await recreate_schema(connection, reset)
+
+        users = [
+            dict(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                display_name=f"사용자 {index}",
+                password="x" * 60,
+                is_host=index < hosts,
+            )
+            for index in range(hosts + guests)
+        ]
+        await connection.execute(insert(User), users)
+        await connection.execute(insert(Calendar), [
+            dict(
+                host_id=host_id,
+                topics=["커리어", "코드 리뷰"],
+                description="부하 테스트용 캘린더",
+                google_calendar_id=f"calendar-{host_id}",
+            )
+            for host_id in range(1, hosts + 1)
+        ])
+
+        time_slots = []
+        for calendar_id in range(1, hosts + 1):
+            for index in range(slots_per_host):
+                weekdays = [index % 7]
+                time_slots.append(dict(
+                    calendar_id=calendar_id,
+                    start_time=dt_time(8 + index % 10),
+                    end_time=dt_time(9 + index % 10),
+                    weekdays=weekdays,
+                    weekday_mask=weekdays_to_mask(weekdays),
+                ))
+        await connection.execute(insert(TimeSlot), time_slots)
+
+        first_monday = date(2024, 1, 1)
+        bookings = []
+        for time_slot_id, slot in enumerate(time_slots, start=1):
+            first_day = first_monday + timedelta(days=slot["weekdays"][0])
+            for week in range(bookings_per_slot):
+                bookings.append(dict(
+                    time_slot_id=time_slot_id,
+                    guest_id=hosts + 1 + random.randrange(guests),
+                    when=first_day + timedelta(weeks=week),
+                    topic="코드 리뷰",
+                    description="부하 테스트 예약",
+                ))
+        for start in range(0, len(bookings), 5000):
+            await connection.execute(insert(Booking), bookings[start:start + 5000])
+
+    return {
+        "hosts": hosts,
+        "guests": guests,
+        "time_slots": len(time_slots),
+        "slot_weekdays": [slot["weekdays"][0] for slot in time_slots],
+        "bookings": len(bookings),
+        "first_guest_id": hosts + 1,
+        "next_week": bookings_per_slot,
+    }
+
+
+def build_scenarios(data: dict) -> dict:
+    counter = iter(range(10**9))
+
+    def calendar_detail():
+        return "GET", f"/calendars/{random.randint(1, data['hosts'])}", None
+
+    def guest_bookings():
+        guest_id = data["first_guest_id"] + random.randrange(data["guests"])
+        return "GET", f"/guests/{guest_id}/bookings?limit=50", None
+
+    def time_slot_bookings():
+        return "GET", f"/time-slots/{random.randint(1, data['time_slots'])}/bookings?limit=50", None
+
+    def bulk_create():
+        # 시드 이후 주차에 겹치지 않는 예약을 만든다.
+        week = data["next_week"] + next(counter)
+        time_slot_id = random.randint(1, data["time_slots"])
+        weekday = data["slot_weekdays"][time_slot_id - 1]
+        when = date(2024, 1, 1) + timedelta(days=weekday, weeks=week)
+        payload = {"bookings": [{
+            "time_slot_id": time_slot_id,
+            "guest_id": data["first_guest_id"],
+            "when": when.isoformat(),
+            "topic": "코드 리뷰",
+        }]}
+        return "POST", "/bookings/bulk", payload
+
+    # (이름, 요청 생성 함수, 가중치)
+    return {
+        "GET /calendars/{id}": (calendar_detail, 5),
+        "GET /guests/{id}/bookings": (guest_bookings, 3),
+        "GET /time-slots/{id}/bookings": (time_slot_bookings, 3),
+        "POST /bookings/bulk": (bulk_create, 1),
+    }
+
+
+async def run_load(scenarios: dict, concurrency: int, duration: float) -> dict:
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    names = list(scenarios)
+    weights = [scenarios[name][1] for name in names]
+    deadline = time.perf_counter() + duration
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        async def worker():
+            while time.perf_counter() < deadline:
+                name = random.choices(names, weights)[0]
+                method, url, payload = scenarios[name][0]()
+                started_at = time.perf_counter()
+                response = await client.request(method, url, json=payload)
+                latencies[name].append(time.perf_counter() - started_at)
+                if response.status_code >= 400:
+                    errors[name] += 1
+                elif method == "POST" and response.json().get("rejected"):
+                    # 일괄 예약은 일부가 거절돼도 200 이므로 거절된 항목이 있으면 오류로 센다.
+                    errors[name] += 1
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+    report = {}
+    for name in names:
+        samples = latencies[name]
+        if len(samples) < 2:
+            continue
+        cuts = quantiles(samples, n=100, method="inclusive")
+        report[name] = {
+            "requests": len(samples),
+            "errors": errors[name],
+            "rps": len(samples) / elapsed,
+            "p50_ms": cuts[49] * 1000,
+            "p95_ms": cuts[94] * 1000,
+            "p99_ms": cuts[98] * 1000,
+        }
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(f"{'endpoint':<32} {'reqs':>7} {'err':>5} {'rps':>9} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, row in report.items():
+        print(
+            f"{name:<32} {row['requests']:>7} {row['errors']:>5} {row['rps']:>9.1f}"
+            f" {row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms {row['p99_ms']:>6.1f}ms"
+        )
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, expected in baseline.items():
+        actual = report.get(name)
+        if actual is None:
+            regressions.append(f"{name}: 측정되지 않았습니다.")
+            continue
+        if actual["errors"] > expected.get("errors", 0):
+            regressions.append(f"{name}: 오류 {actual['errors']}건")
+        if actual["rps"] < expected["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: 처리량 {expected['rps']:.1f} -> {actual['rps']:.1f} rps")
+        if actual["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {expected['p95_ms']:.1f} -> {actual['p95_ms']:.1f} ms")
+    return regressions
+
+
+async def main_async(args) -> int:
+    random.seed(args.seed)
+    data = await seed(args.hosts, args.slots_per_host, args.bookings_per_slot, args.guests, args.reset_db)
+    print(
+        f"seeded {data['hosts']} hosts, {data['time_slots']} time slots, "
+        f"{data['bookings']} bookings ({database.config.dsn})"
+    )
+    try:
+        report = await run_load(build_scenarios(data), args.concurrency, args.duration)
+    finally:
+        await database.dispose()
+    print_report(report)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        print(f"baseline saved to {args.save_baseline}")
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--guests", type=int, default=200)
+    parser.add_argument("--slots-per-host", type=int, default=20)
+    parser.add_argument("--bookings-per-slot", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="초 단위")
+    parser.add_argument("--seed", type=int, default=20)
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", help="이번 결과를 기준으로 저장할 경로")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    add_database_arguments(parser)
+    return asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""동시 로그인 처리량과 그동안의 이벤트 루프 지연을 잰다.
+
+    python -m benchmarks.login --logins 200 --concurrency 50
+
+같은 부하를 이벤트 루프에서 직접 해시하는 경우(inline)와
+스레드 풀에서 해시하는 경우(pool)로 나눠 돌린다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks._database import add_database_arguments, recreate_schema, use_benchmark_database
+
+use_benchmark_database("login")
+
+from appserver.apps.account.models import User
+from appserver.apps.account.passwords import PasswordHasher, ScryptParams
+from appserver.apps.account.service import authenticate
+from appserver.apps.calendar import models  # noqa: F401 매퍼 설정에 필요
+from appserver.db import database
+from appserver.settings import settings
+
+PASSWORD = "correct horse battery staple"
+
+
+class InlineHasher(PasswordHasher):
+    """비교용: 해시를 이벤트 루프에서 그대로 계산한다."""
+
+    async def _run(self, func, *args):
+        return func(*args)
+
+
+async def seed(hasher: PasswordHasher, users: int, reset: bool = False) -> None:
+    async with database.engine.begin() as connection:
+        await recreate_schema(connection, reset)
+    encoded = await hasher.hash(PASSWORD)
+    async with database.session_factory() as session:
+        session.add_all([
+            User(username=f"user{index}", email=f"user{index}@example.com", display_name="사용자", password=encoded)
+            for index in range(users)
+        ])
+        await session.commit()
+
+
+async def watch_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    worst = 0.0
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started_at - interval)
+    return worst
+
+
+async def run(hasher: PasswordHasher, logins: int, concurrency: int, users: int) -> tuple[float, float]:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def login(index: int) -> None:
+        async with slots, database.session_factory() as session:
+            user = await authenticate(session, f"user{index % users}", PASSWORD, hasher=hasher)
+            assert user is not None
+
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop_lag(stop))
+    started_at = time.perf_counter()
+    await asyncio.gather(*(login(index) for index in range(logins)))
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    return elapsed, await watcher
+
+
+async def main_async(logins: int, concurrency: int, workers: int, reset: bool) -> int:
+    params = ScryptParams(settings.password_scrypt_n, settings.password_scrypt_r, settings.password_scrypt_p)
+    users = min(logins, 100)
+    hashers = {
+        "inline": InlineHasher(params),
+        "pool": PasswordHasher(params, workers=workers),
+    }
+    await seed(hashers["pool"], users, reset)
+    print(f"scrypt n={params.n} r={params.r} p={params.p}, {logins} logins, concurrency {concurrency}")
+    for name, hasher in hashers.items():
+        elapsed, lag = await run(hasher, logins, concurrency, users)
+        hasher.shutdown()
+        print(f"{name:>6}: {logins / elapsed:7.1f} logins/s, worst loop lag {lag * 1000:7.1f} ms")
+    await database.dispose()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=settings.password_hash_workers)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args.logins, args.concurrency, args.workers, args.reset_db))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""한 시간대의 같은 날짜에 동시 예약을 몰아 보내는 스트레스 테스트.
+
+    python -m benchmarks.reservation_stress --requests 500
+
+정확히 한 건만 201 이고 나머지는 모두 409 여야 하며, 아니면 1로 끝난다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from datetime import date, time as dt_time
+
+from benchmarks._database import add_database_arguments, recreate_schema, use_benchmark_database
+
+use_benchmark_database("stress")
+
+import httpx
+from sqlalchemy import func, select
+
+from appserver.app import app
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.db import database
+
+
+async def seed(reset: bool = False) -> tuple[int, list[int]]:
+    async with database.engine.begin() as connection:
+        await recreate_schema(connection, reset)
+    async with database.session_factory() as session:
+        host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+        guests = [
+            User(username=f"guest{index}", email=f"guest{index}@example.com", display_name="게스트", password="x")
+            for index in range(50)
+        ]
+        session.add(host)
+        session.add_all(guests)
+        await session.flush()
+        calendar = Calendar(host_id=host.id, topics=["커리어"], description="", google_calendar_id="stress")
+        session.add(calendar)
+        await session.flush()
+        time_slot = TimeSlot(calendar_id=calendar.id, start_time=dt_time(10), end_time=dt_time(11), weekdays=[0])
+        session.add(time_slot)
+        await session.commit()
+        return time_slot.id, [guest.id for guest in guests]
+
+
+async def main_async(requests: int, reset: bool) -> int:
+    time_slot_id, guest_ids = await seed(reset)
+    when = date(2024, 1, 1)  # 월요일
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://stress") as client:
+        async def reserve(index: int) -> int:
+            response = await client.post("/bookings", json={
+                "time_slot_id": time_slot_id,
+                "guest_id": guest_ids[index % len(guest_ids)],
+                "when": when.isoformat(),
+                "topic": "커리어",
+            })
+            return response.status_code
+
+        started_at = time.perf_counter()
+        statuses = Counter(await asyncio.gather(*(reserve(index) for index in range(requests))))
+        elapsed = time.perf_counter() - started_at
+
+    async with database.session_factory() as session:
+        stored = await session.scalar(select(func.count()).select_from(Booking))
+    await database.dispose()
+
+    print(f"{requests} reservations in {elapsed:.2f}s ({requests / elapsed:.0f} req/s)")
+    print(f"statuses: {dict(statuses)}, stored bookings: {stored}")
+    ok = statuses[201] == 1 and statuses[409] == requests - 1 and stored == 1
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    add_database_arguments(parser)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args.requests, args.reset_db))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""캘린더 화면 크기의 응답을 직렬화하는 경로별 비용을 비교한다.
+
+    python -m benchmarks.serialization
+"""
+import json
+import timeit
+from datetime import date, time, timedelta
+
+from fastapi.encoders import jsonable_encoder
+from pydantic_core import to_json
+
+from appserver.apps.account import models  # noqa
+from appserver.apps.calendar.models import Booking, TimeSlot
+from appserver.apps.calendar.schemas import BookingOut, BookingPageOut, CalendarDetailOut, TimeSlotOut
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def build_calendar(slot_count: int = 300) -> CalendarDetailOut:
+    time_slots = [
+        TimeSlot(
+            id=index,
+            start_time=time(index % 24),
+            end_time=time((index + 1) % 24),
+            weekdays=[index % 7, (index + 3) % 7],
+            calendar_id=1,
+        )
+        for index in range(slot_count)
+    ]
+    return CalendarDetailOut(
+        id=1,
+        host_id=1,
+        topics=["커리어", "코드 리뷰", "FastAPI", "데이터베이스"],
+        description="게스트에게 보여 줄 설명 " * 20,
+        time_slots=[TimeSlotOut.model_validate(slot, from_attributes=True) for slot in time_slots],
+    )
+
+
+def build_booking_page(size: int = 500) -> BookingPageOut:
+    start = date(2024, 1, 1)
+    bookings = [
+        Booking(
+            id=index,
+            when=start + timedelta(days=index),
+            topic="코드 리뷰",
+            description="예약 설명 " * 10,
+            time_slot_id=index % 40,
+            guest_id=index % 90,
+        )
+        for index in range(size)
+    ]
+    return BookingPageOut(
+        items=[BookingOut.model_validate(booking, from_attributes=True) for booking in bookings],
+        next_cursor="MjAyNC0wMS0wMXwx",
+    )
+
+
+def main(number: int = 200) -> None:
+    payloads = {
+        "calendar": build_calendar(),
+        "booking page": build_booking_page(),
+    }
+    paths = {
+        "jsonable_encoder + json.dumps": lambda model: json.dumps(jsonable_encoder(model)).encode(),
+        "model_dump + json.dumps": lambda model: json.dumps(model.model_dump(mode="json")).encode(),
+        "pydantic_core.to_json": to_json,
+    }
+    if orjson is not None:
+        paths["model_dump + orjson.dumps"] = lambda model: orjson.dumps(model.model_dump(mode="json"))
+
+    for payload_name, payload in payloads.items():
+        print(f"[{payload_name}] {len(to_json(payload)):,} bytes")
+        baseline = None
+        for path_name, serialize in paths.items():
+            elapsed = timeit.timeit(lambda: serialize(payload), number=number) / number
+            baseline = baseline or elapsed
+            print(f"  {path_name:<32} {elapsed * 1e6:9.1f} us  x{baseline / elapsed:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from sqlmodel import SQLModel
+
+from appserver.apps.calendar import occurrences
+from appserver.db import create_engine, create_session, database
+
+# 모델을 모두 읽어 두어야 create_all 이 전체 테이블을 만든다.
+import appserver.apps.account.models  # noqa: F401
+import appserver.apps.calendar.models  # noqa: F401
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    async_engine = create_engine("sqlite+aiosqlite:///:memory:")
+    async with async_engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    yield async_engine
+    await async_engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    async with create_session(engine)() as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+async def test_database(engine, monkeypatch):
+    """커밋 후 백그라운드 작업이 쓰는 전역 database 도 테스트 엔진을 쓰게 한다."""
+    monkeypatch.setattr(database, "_engine", engine)
+    monkeypatch.setattr(database, "_read_engine", None)
+    monkeypatch.setattr(database, "_session_factory", None)
+    monkeypatch.setattr(database, "_read_session_factory", None)
+    yield database
+    # 엔진을 닫기 전에 남은 slot_occurrences 재생성 작업을 마친다.
+    await asyncio.gather(*occurrences._background_tasks, return_exceptions=True)
@@ -0,0 +1,68 @@
+import json
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.archive import archive_bookings, archive_cutoff
+from appserver.apps.calendar.listing import list_bookings, stream_bookings_ndjson
+from appserver.apps.calendar.models import Booking, BookingArchive, Calendar, TimeSlot
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def bookings(session):
+    cutoff = archive_cutoff()
+    await session.execute(insert(User), [
+        dict(username=f"user{index}", email=f"user{index}@example.com", display_name="사용자", password="x")
+        for index in range(2)
+    ])
+    await session.execute(insert(Calendar), [
+        dict(host_id=1, topics=["커리어"], description="", google_calendar_id="archive")
+    ])
+    await session.execute(insert(TimeSlot), [
+        dict(calendar_id=1, start_time=time(9), end_time=time(10), weekdays=[0], weekday_mask=1)
+    ])
+    # 기준일 앞뒤로 5건씩
+    await session.execute(insert(Booking), [
+        dict(time_slot_id=1, guest_id=2, when=cutoff + timedelta(days=offset), topic="커리어", description="")
+        for offset in range(-5, 5)
+    ])
+    await session.commit()
+    moved = await archive_bookings(session, before=cutoff, batch_size=2)
+    assert moved == 5
+    return cutoff
+
+
+async def test_list_bookings_pages_across_archive(session, bookings):
+    whens = []
+    cursor = None
+    while True:
+        page = await list_bookings(session, guest_id=2, cursor=cursor, limit=3)
+        whens.extend(item.when for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert whens == [bookings + timedelta(days=offset) for offset in range(-5, 5)]
+
+
+async def test_list_bookings_after_cutoff_reads_bookings_only(session, bookings):
+    # 보관 테이블에만 있는 값을 넣어 두면, 기준일 이후 커서에서 읽히지 않아야 한다.
+    await session.execute(insert(BookingArchive), [
+        dict(id=100, time_slot_id=1, guest_id=2, when=bookings + timedelta(days=1), topic="커리어",
+             description="", created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc))
+    ])
+    first = await list_bookings(session, time_slot_id=1, limit=6)
+    assert first.items[-1].when == bookings
+    rest = await list_bookings(session, time_slot_id=1, cursor=first.next_cursor, limit=5)
+    assert [item.when for item in rest.items] == [bookings + timedelta(days=offset) for offset in range(1, 5)]
+    assert rest.next_cursor is None
+
+
+async def test_export_includes_archived_bookings(session, bookings):
+    lines = b"".join([chunk async for chunk in stream_bookings_ndjson(session, guest_id=2)]).splitlines()
+    whens = [date.fromisoformat(json.loads(line)["when"]) for line in lines]
+    assert whens == [bookings + timedelta(days=offset) for offset in range(-5, 5)]
+    assert await session.get(BookingArchive, 1) is not None
@@ -0,0 +1,103 @@
+import asyncio
+from datetime import date, time
+
+import httpx
+import pytest
+from sqlalchemy import event, func, select, text
+
+from appserver.app import app
+from appserver.apps.account.models import User
+from appserver.apps.calendar import occurrences
+from appserver.apps.calendar.bookings import reserve_booking
+from appserver.apps.calendar.exceptions import AlreadyBookedError
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.schemas import BookingCreateIn
+from appserver.metrics import RequestStats, _current_stats
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_reserve_booking_is_one_statement(session, monkeypatch):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="reserve")
+    time_slot = TimeSlot(calendar=calendar, start_time=time(9), end_time=time(10), weekdays=[0])
+    session.add(time_slot)
+    await session.commit()
+    calendar_id, time_slot_id, guest_id = calendar.id, time_slot.id, host.id
+
+    changed = []
+    monkeypatch.setattr("appserver.apps.calendar.cache.calendar_change_hooks", [changed.append])
+    item = BookingCreateIn(time_slot_id=time_slot_id, guest_id=guest_id, when=date(2030, 1, 7), topic="커리어", description="")
+
+    stats = RequestStats()
+    token = _current_stats.set(stats)
+    try:
+        booking = await reserve_booking(session, item)
+    finally:
+        _current_stats.reset(token)
+    assert booking.id is not None
+    # 성공 경로는 INSERT ... RETURNING 한 번뿐이다.
+    assert stats.query_count == 1
+    assert changed == [{calendar_id}]
+
+    with pytest.raises(AlreadyBookedError):
+        await reserve_booking(session, item)
+
+
+async def test_booking_for_unknown_guest_is_not_found(session):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="unknown-guest")
+    time_slot = TimeSlot(calendar=calendar, start_time=time(9), end_time=time(10), weekdays=[0])
+    session.add(time_slot)
+    await session.commit()
+    # 테스트 엔진은 연결 하나를 같이 쓰므로 엔드포인트의 세션에도 외래 키 검사가 켜진다.
+    await session.execute(text("PRAGMA foreign_keys=ON"))
+    await session.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/bookings", json={
+            "time_slot_id": time_slot.id,
+            "guest_id": 9999,
+            "when": "2030-01-07",
+            "topic": "커리어",
+            "description": "",
+        })
+    assert response.status_code == 404
+    assert await session.scalar(select(func.count()).select_from(Booking)) == 0
+
+
+async def test_flushing_many_bookings_looks_up_calendars_once(engine, session, monkeypatch):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="bulk")
+    time_slots = [
+        TimeSlot(calendar=calendar, start_time=time(hour), end_time=time(hour, 30), weekdays=list(range(7)))
+        for hour in range(9, 13)
+    ]
+    session.add_all(time_slots)
+    await session.commit()
+    calendar_id = calendar.id
+    # 시간대를 만들면서 시작된 slot_occurrences 재생성이 끝난 뒤에 센다.
+    await asyncio.gather(*occurrences._background_tasks)
+
+    changed = []
+    monkeypatch.setattr("appserver.apps.calendar.cache.calendar_change_hooks", [changed.append])
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        session.add_all([
+            Booking(time_slot_id=time_slot.id, guest_id=host.id, when=date(2030, 1, day), topic="커리어", description="")
+            for time_slot in time_slots
+            for day in range(1, 26)
+        ])
+        await session.commit()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    lookups = [statement for statement in statements if statement.lstrip().startswith("SELECT") and "time_slots" in statement]
+    assert len(lookups) == 1
+    assert changed == [{calendar_id}]
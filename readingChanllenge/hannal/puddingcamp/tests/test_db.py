@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks import import_time
+
+pytestmark = pytest.mark.anyio
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# conftest 가 전역 database 에 테스트 엔진을 넣어 두므로 새 인터프리터에서 확인한다.
+LAZY_ENGINE_CHECK = """
+import appserver.app
+from appserver.db import database
+assert database._engine is None, "import 만으로 엔진이 만들어졌습니다."
+assert "aiosqlite" not in __import__("sys").modules, "import 만으로 드라이버를 불러왔습니다."
+database.engine
+assert database._engine is not None
+"""
+
+
+async def test_importing_app_does_not_create_engine():
+    env = {**os.environ, "PUDDING_DSN": "sqlite+aiosqlite:///:memory:"}
+    env.pop("PUDDING_REPLICA_DSN", None)
+    completed = subprocess.run(
+        [sys.executable, "-c", LAZY_ENGINE_CHECK],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stderr
+
+
+async def test_app_import_time_budget(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    # CI 기계마다 편차가 크므로 넉넉하게 잡고, 큰 회귀만 잡는다.
+    total_ms, _ = import_time.measure("appserver.app", repeat=1)
+    assert total_ms < 5000
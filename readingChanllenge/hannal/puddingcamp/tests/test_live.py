@@ -0,0 +1,40 @@
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar import occurrences
+from appserver.apps.calendar.live import AvailabilityBroker
+from appserver.apps.calendar.models import Calendar, TimeSlot
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_new_time_slot_is_published_after_regeneration(session, test_database, monkeypatch):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="live")
+    session.add(calendar)
+    await session.commit()
+    calendar_id = calendar.id
+
+    broker = AvailabilityBroker(days=14)
+    monkeypatch.setattr(occurrences, "occurrence_change_hooks", [broker.notify])
+    stream = broker.stream(calendar_id, heartbeat=5)
+    assert b'data: []' in await anext(stream)
+
+    start = datetime.now(timezone.utc) + timedelta(hours=1)
+    session.add(TimeSlot(
+        calendar_id=calendar_id,
+        start_time=time(start.hour),
+        end_time=time(start.hour, 30),
+        weekdays=list(range(7)),
+    ))
+    await session.commit()
+
+    # 커밋 시점의 알림은 재생성 전 일정을 읽을 수 있으므로, 재생성 뒤 알림으로 새 일정이 와야 한다.
+    snapshot = await asyncio.wait_for(anext(stream), 5)
+    while b'"time_slot_id"' not in snapshot:
+        snapshot = await asyncio.wait_for(anext(stream), 5)
+    await stream.aclose()
+    assert broker.subscribers == 0
@@ -0,0 +1,27 @@
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from appserver.metrics import RequestStats, _current_stats
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_failed_statement_does_not_skew_next_query(engine):
+    stats = RequestStats()
+    token = _current_stats.set(stats)
+    try:
+        async with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                await connection.execute(text("SELECT * FROM no_such_table"))
+            time.sleep(0.05)
+            await connection.execute(text("SELECT 1"))
+    finally:
+        _current_stats.reset(token)
+
+    assert stats.query_count == 2
+    # 두 문장 모두 sleep 시간이 섞이지 않아야 한다.
+    assert stats.db_time < 0.05
+    assert stats.slowest_statement is not None
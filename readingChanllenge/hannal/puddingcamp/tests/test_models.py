@@ -0,0 +1,47 @@
+from datetime import time
+
+import pytest
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.exceptions import InvalidFieldError
+from appserver.apps.calendar.models import Calendar, TimeSlot
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def calendar(session):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="models")
+    session.add(calendar)
+    await session.commit()
+    return calendar
+
+
+async def test_weekdays_are_normalised_on_write(session, calendar):
+    time_slot = TimeSlot(calendar=calendar, start_time=time(9), end_time=time(10), weekdays=[3, 1, 1])
+    session.add(time_slot)
+    await session.commit()
+
+    assert time_slot.weekdays == [1, 3]
+    assert time_slot.weekday_mask == 0b1010
+
+
+async def test_invalid_weekday_is_rejected(session, calendar):
+    session.add(TimeSlot(calendar=calendar, start_time=time(9), end_time=time(10), weekdays=[9]))
+    with pytest.raises(InvalidFieldError) as excinfo:
+        await session.flush()
+    await session.rollback()
+
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.detail[0]["loc"] == ("weekdays", 0)
+
+
+async def test_non_string_topic_is_rejected(session, calendar):
+    calendar.topics = [1]
+    with pytest.raises(InvalidFieldError) as excinfo:
+        await session.flush()
+    await session.rollback()
+
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.detail[0]["loc"] == ("topics", 0)
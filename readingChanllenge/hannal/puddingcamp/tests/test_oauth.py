@@ -0,0 +1,56 @@
+import pytest
+
+from appserver.apps.account import oauth
+from appserver.apps.account.models import OAuthAccount, User
+from appserver.apps.account.oauth import find_oauth_login, oauth_cache, oauth_key
+from appserver.db import create_session
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def clear_oauth_cache():
+    oauth_cache.clear()
+    yield
+    oauth_cache.clear()
+
+
+@pytest.fixture
+async def user(session):
+    user = User(username="guest", email="guest@example.com", display_name="게스트", password="x")
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def test_link_committed_during_lookup_is_not_hidden(engine, session, user, monkeypatch):
+    load = oauth._load_oauth_login
+
+    async def load_then_link(*args):
+        login = await load(*args)
+        # 조회가 끝난 뒤, 캐시에 쓰기 전에 다른 요청이 계정을 연결하고 커밋한다.
+        async with create_session(engine)() as other:
+            other.add(OAuthAccount(provider="google", provider_account_id="1", user_id=user.id))
+            await other.commit()
+        return login
+
+    monkeypatch.setattr(oauth, "_load_oauth_login", load_then_link)
+    assert await find_oauth_login(session, "google", "1") is None
+    assert oauth_cache.get_nowait(oauth_key("google", "1")) is None
+
+    monkeypatch.setattr(oauth, "_load_oauth_login", load)
+    login = await find_oauth_login(session, "google", "1")
+    assert login is not None and login.user_id == user.id
+
+
+async def test_changing_provider_account_id_invalidates_old_key(session, user):
+    account = OAuthAccount(provider="google", provider_account_id="old", user_id=user.id)
+    session.add(account)
+    await session.commit()
+    assert await find_oauth_login(session, "google", "old") is not None
+
+    account.provider_account_id = "new"
+    await session.commit()
+    assert oauth_cache.get_nowait(oauth_key("google", "old")) is None
+    assert await find_oauth_login(session, "google", "old") is None
+    assert await find_oauth_login(session, "google", "new") is not None
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar import occurrences
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.repositories import get_calendar_by_host, get_user
+from appserver.db import create_session
+
+pytestmark = pytest.mark.anyio
+
+TODAY = date(2030, 1, 1)
+
+
+@pytest.fixture
+async def seeded(session):
+    host = User(username="host", email="host@example.com", display_name="호스트", password="x", is_host=True)
+    guest = User(username="guest", email="guest@example.com", display_name="게스트", password="x")
+    calendar = Calendar(host=host, topics=["커리어"], description="", google_calendar_id="profiles")
+    time_slots = [
+        TimeSlot(calendar=calendar, start_time=time(hour), end_time=time(hour, 30), weekdays=list(range(7)))
+        for hour in range(9, 12)
+    ]
+    session.add_all([guest, *time_slots])
+    await session.flush()
+    session.add_all([
+        Booking(time_slot_id=time_slot.id, guest_id=guest.id, when=when, topic="커리어", description="")
+        for time_slot in time_slots
+        for when in (date(2029, 12, 1), date(2030, 1, 2), date(2030, 1, 3))
+    ])
+    await session.commit()
+    await asyncio.gather(*occurrences._background_tasks)
+    return host.id, guest.id
+
+
+@pytest.fixture
+def statements(engine):
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def test_host_calendar_profile_statement_count(engine, seeded, statements):
+    host_id, _ = seeded
+    # 앞서 읽어 둔 객체를 재사용하지 않도록 새 세션에서 읽는다.
+    async with create_session(engine)() as session:
+        statements.clear()
+        calendar = await get_calendar_by_host(session, host_id, profile="host_calendar", today=TODAY)
+        upcoming = [booking.when for time_slot in calendar.time_slots for booking in time_slot.bookings]
+
+    # 캘린더+호스트 JOIN, 시간대, 예약을 한 번씩 읽는다.
+    assert len(statements) == 3
+    assert calendar.host.id == host_id
+    assert len(calendar.time_slots) == 3
+    assert sorted(set(upcoming)) == [date(2030, 1, 2), date(2030, 1, 3)]
+
+
+async def test_guest_bookings_profile_statement_count(engine, seeded, statements):
+    _, guest_id = seeded
+    async with create_session(engine)() as session:
+        statements.clear()
+        guest = await get_user(session, guest_id, profile="guest_bookings")
+        host_ids = {booking.time_slot.calendar.host_id for booking in guest.bookings}
+
+    # 사용자 한 번, 예약+시간대+캘린더 JOIN 한 번.
+    assert len(statements) == 2
+    assert len(guest.bookings) == 9
+    assert len(host_ids) == 1